@@ -0,0 +1,137 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+import discord
+
+from metrics import Counter, Histogram
+
+DELIVERY_LATENCY = Histogram(
+    "dcbot_announcement_delivery_seconds",
+    "Time to deliver an announcement to one channel",
+    ["announcement"],
+)
+DELIVERIES = Counter("dcbot_announcement_deliveries_total", "Announcement deliveries by result", ["announcement", "result"])
+
+
+@dataclass(frozen=True)
+class Target:
+    """A channel to announce in, optionally pinging a role there
+
+    ``partner`` marks an operator-configured channel in another guild.
+    """
+    channel_id: int
+    role_id: Optional[int] = None
+    partner: bool = False
+
+
+@dataclass
+class Delivery:
+    target: Target
+    latency: float
+    message: Optional[discord.Message] = None
+    error: Optional[str] = None
+    # The message went out but the ``after`` hook (e.g. adding a reaction) failed
+    warning: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DuplicateAnnouncement(Exception):
+    def __init__(self, age: float):
+        super().__init__(f"Already announced {age:.0f}s ago")
+        self.age = age
+
+
+class Announcer:
+    """Fans one prebuilt embed out to many channels with bounded parallelism
+
+    ``claim`` refuses a second announcement under the same key within
+    ``dedupe_window`` seconds, which catches double-clicked commands and two
+    staff announcing the same thing at once. Channel lookups are global, so
+    with a ``guild_id`` every non-partner target must be in that guild.
+    """
+
+    def __init__(self, bot: discord.Client, *, concurrency: int = 5, dedupe_window: float = 60):
+        self.bot = bot
+        self.dedupe_window = dedupe_window
+        self._sem = asyncio.Semaphore(concurrency)
+        self._recent: Dict[Hashable, float] = {}
+
+    def claim(self, key: Hashable):
+        """Reserve ``key`` for an announcement, raising DuplicateAnnouncement if taken"""
+        now = time.monotonic()
+        # Forget expired keys so the dict stays as small as the window
+        self._recent = {k: t for k, t in self._recent.items() if now - t < self.dedupe_window}
+        if key in self._recent:
+            raise DuplicateAnnouncement(now - self._recent[key])
+        self._recent[key] = now
+
+    def release(self, key: Hashable):
+        """Give up a claim, e.g. when nothing was delivered and a retry is fine"""
+        self._recent.pop(key, None)
+
+    async def _deliver(
+        self,
+        name: str,
+        target: Target,
+        embed: discord.Embed,
+        guild_id: Optional[int],
+        after: Optional[Callable[[discord.Message], Awaitable]],
+    ) -> Delivery:
+        async with self._sem:
+            start = time.perf_counter()
+            try:
+                channel = self.bot.get_channel(target.channel_id)
+                if channel is None:
+                    raise LookupError("channel not found")
+                if guild_id is not None and not target.partner and channel.guild.id != guild_id:
+                    raise PermissionError("channel is in another server")
+                content = f"<@&{target.role_id}>" if target.role_id else None
+                message = await channel.send(
+                    content=content,
+                    embed=embed,
+                    allowed_mentions=discord.AllowedMentions(roles=True),
+                )
+            except Exception as e:
+                DELIVERIES.inc(announcement=name, result="failed")
+                return Delivery(target, time.perf_counter() - start, error=str(e) or type(e).__name__)
+            latency = time.perf_counter() - start
+            DELIVERY_LATENCY.observe(latency, announcement=name)
+            DELIVERIES.inc(announcement=name, result="delivered")
+            delivery = Delivery(target, latency, message=message)
+            if after is not None:
+                try:
+                    await after(message)
+                except Exception as e:
+                    delivery.warning = str(e) or type(e).__name__
+            return delivery
+
+    async def announce(
+        self,
+        name: str,
+        embed: discord.Embed,
+        targets: Iterable[Target],
+        *,
+        guild_id: Optional[int] = None,
+        after: Optional[Callable[[discord.Message], Awaitable]] = None,
+    ) -> List[Delivery]:
+        """Send ``embed`` to every target concurrently; each channel gets it once"""
+        unique = list({target.channel_id: target for target in targets}.values())
+        return await asyncio.gather(*(self._deliver(name, t, embed, guild_id, after) for t in unique))
+
+
+def delivery_report(deliveries: List[Delivery]) -> str:
+    """One line per target with its latency, for the command's follow-up"""
+    lines = []
+    for d in sorted(deliveries, key=lambda d: d.latency):
+        if d.ok:
+            line = f"✅ <#{d.target.channel_id}> in {d.latency * 1000:.0f} ms"
+            lines.append(f"{line} (⚠️ {d.warning})" if d.warning else line)
+        else:
+            lines.append(f"❌ <#{d.target.channel_id}>: {d.error}")
+    delivered = sum(1 for d in deliveries if d.ok)
+    return f"Delivered to {delivered}/{len(deliveries)} channel(s)\n" + "\n".join(lines)
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import discord
+
+from member_cache import all_members
+from metrics import Counter, Gauge, Histogram
+
+log = logging.getLogger(__name__)
+
+ASSIGN_LATENCY = Histogram(
+    "dcbot_autorole_assign_seconds",
+    "Time from member join to auto-role assignment",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900),
+)
+ASSIGNED = Counter("dcbot_autorole_results_total", "Auto-role assignment attempts by result", ["result"])
+BACKLOG = Gauge("dcbot_autorole_backlog", "Joins waiting for their auto-role")
+
+# Kept next to the database unless set, so it moves with DCBOT_DB_PATH
+BACKLOG_PATH = os.getenv('DCBOT_AUTOROLE_BACKLOG') or os.path.join(
+    os.path.dirname(os.getenv('DCBOT_DB_PATH', 'dcbot.db')), '.autorole_backlog.json'
+)
+
+# (guild_id, member_id) -> join timestamp
+PendingKey = Tuple[int, int]
+
+
+class AutoRoleWorker:
+    """Assigns the join role through a bounded worker pool with a persisted backlog
+
+    Pending joins are written to ``backlog_path`` so members who join while
+    the bot is restarting or reconnecting still get their role afterwards.
+    ``role_for`` maps a guild ID to its auto-role, or None when it has none.
+    """
+
+    def __init__(
+        self,
+        bot: discord.Client,
+        role_for: Callable[[int], Optional[int]],
+        *,
+        concurrency: int = 3,
+        backlog_path: str = BACKLOG_PATH,
+        max_attempts: int = 5,
+    ):
+        self.bot = bot
+        self.role_for = role_for
+        self.concurrency = concurrency
+        self.backlog_path = backlog_path
+        self.max_attempts = max_attempts
+        self._pending: Dict[PendingKey, float] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._dirty = asyncio.Event()
+        BACKLOG.set_function(lambda: len(self._pending))
+
+    # ======================
+    # LIFECYCLE
+    # ======================
+
+    async def start(self):
+        for (guild_id, member_id), joined in (await asyncio.to_thread(self._load)).items():
+            self._add(guild_id, member_id, joined, persist=False)
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"autorole-{i}") for i in range(self.concurrency)
+        ]
+        self._flusher = asyncio.create_task(self._flush_loop(), name="autorole-backlog")
+
+    async def close(self):
+        for task in [*self._workers, self._flusher]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*self._workers, *(t for t in [self._flusher] if t), return_exceptions=True)
+        self._workers = []
+        self._flusher = None
+        await asyncio.to_thread(self._save, dict(self._pending))
+
+    def _load(self) -> Dict[PendingKey, float]:
+        try:
+            with open(self.backlog_path, encoding="utf-8") as f:
+                rows = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {(int(g), int(m)): float(t) for g, m, t in rows}
+
+    def _save(self, pending: Dict[PendingKey, float]):
+        tmp = f"{self.backlog_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([[g, m, t] for (g, m), t in pending.items()], f)
+        os.replace(tmp, self.backlog_path)
+
+    async def _flush_loop(self):
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            await asyncio.to_thread(self._save, dict(self._pending))
+            # Coalesce bursts of joins into one write per second
+            await asyncio.sleep(1)
+
+    # ======================
+    # QUEUEING
+    # ======================
+
+    def _add(self, guild_id: int, member_id: int, joined: float, persist: bool = True):
+        key = (guild_id, member_id)
+        if key in self._pending:
+            return
+        self._pending[key] = joined
+        self._queue.put_nowait((key, 1))
+        if persist:
+            self._dirty.set()
+
+    def enqueue(self, member: discord.Member):
+        joined = member.joined_at.timestamp() if member.joined_at else time.time()
+        self._add(member.guild.id, member.id, joined)
+
+    async def reconcile(self, guild: discord.Guild, since: float = 0) -> int:
+        """Queue every member who joined at or after ``since`` and is missing the auto-role"""
+        role_id = self.role_for(guild.id)
+        if role_id is None or guild.get_role(role_id) is None:
+            return 0
+        members = await all_members(guild)
+        missing = [
+            m for m in members
+            if not m.bot and m.get_role(role_id) is None
+            and (m.joined_at is None or m.joined_at.timestamp() >= since)
+        ]
+        for member in missing:
+            self.enqueue(member)
+        return len(missing)
+
+    # ======================
+    # WORKERS
+    # ======================
+
+    async def _assign(self, guild_id: int, member_id: int) -> bool:
+        role_id = self.role_for(guild_id)
+        if role_id is None:
+            # The guild turned its auto-role off after this member joined
+            return False
+        # Straight to the REST route: no Member object (or member cache) required
+        await self.bot.http.add_role(guild_id, member_id, role_id, reason="Auto-role on join")
+        return True
+
+    async def _work(self):
+        while True:
+            key, attempt = await self._queue.get()
+            guild_id, member_id = key
+            try:
+                assigned = await self._assign(guild_id, member_id)
+            except discord.HTTPException as e:
+                if e.status == 429 or e.status >= 500:
+                    if attempt < self.max_attempts:
+                        await asyncio.sleep(getattr(e, "retry_after", None) or 2 ** attempt)
+                        self._queue.put_nowait((key, attempt + 1))
+                        continue
+                ASSIGNED.inc(result="failed" if e.status != 404 else "left")
+                log.warning("Failed to assign auto-role to %s: %s", member_id, e)
+            except Exception:
+                ASSIGNED.inc(result="failed")
+                log.exception("Failed to assign auto-role to %s", member_id)
+            else:
+                if assigned:
+                    latency = time.time() - self._pending.get(key, time.time())
+                    ASSIGN_LATENCY.observe(latency)
+                    ASSIGNED.inc(result="assigned")
+                    log.info("Assigned auto-role to %s in %.2fs", member_id, latency)
+                else:
+                    ASSIGNED.inc(result="skipped")
+            finally:
+                self._queue.task_done()
+            self._pending.pop(key, None)
+            self._dirty.set()
@@ -0,0 +1,175 @@
+"""Load-test every slash command handler offline.
+
+Drives each command through the fakes in harness.py at a given concurrency
+and reports throughput, p50/p99 latency and allocations per call.
+
+    python benchmarks/bench_commands.py --calls 200 --concurrency 20 --rest-latency-ms 5
+
+With --max-p99-ms the script exits non-zero when any command is slower,
+so it can gate CI runs.
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+from discord import app_commands
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from harness import OfflineBot  # noqa: E402
+
+
+def scenarios(h: OfflineBot):
+    """Command name -> factory returning fresh keyword arguments per call"""
+    guild = h.guild
+    low = guild.get_role(1)
+    low.position = 5
+
+    def target():
+        return guild.add_member([low], name="Target")
+
+    def ride_along():
+        # A fresh open session per call, so every close has something to close
+        channel = guild.get_channel(1)
+        h.bot.get_cog("Announcements").tracker.open(next(message_ids), channel.id, guild.id, h.staff.id)
+        return {}
+
+    message_ids = itertools.count(1)
+
+    def bulk_targets(count: int = 10, unknown: int = 5) -> str:
+        # Members in the guild plus IDs that aren't, so lookups go past the cache
+        mentions = [target().mention for _ in range(count)]
+        return " ".join(mentions + [str(next(unknown_ids)) for _ in range(unknown)])
+
+    unknown_ids = itertools.count(9 * 10**17)
+
+    return {
+        "kick": lambda: {"member": target(), "reason": "harness"},
+        "ban": lambda: {"member": target(), "reason": "harness", "delete_days": 0},
+        "addrole": lambda: {"user": target(), "role": low},
+        "removerole": lambda: {"user": target(), "role": low},
+        "nick": lambda: {"user": target(), "nickname": "renamed"},
+        "echo": lambda: {"message": "hello", "channel": None, "silent": True},
+        "masskick": lambda: {"targets": bulk_targets(), "reason": "harness"},
+        "massban": lambda: {"targets": bulk_targets(), "reason": "harness", "delete_days": 0},
+        "massrole": lambda: {
+            "role": guild.get_role(3),
+            "action": app_commands.Choice(name="Add", value="add"),
+            "targets": bulk_targets(unknown=0),
+        },
+        "erlc run": lambda: {"command": ":h harness"},
+        "erlc status": lambda: {},
+        "erlc players": lambda: {},
+        "erlc queue": lambda: {},
+        "infraction": lambda: {
+            "user": target(),
+            "punishment": app_commands.Choice(name="Warning", value="Warning"),
+            "reason": "harness",
+            "approved_by": "Harness",
+        },
+        "history": lambda: {"user": h.staff, "limit": 10},
+        "ssu": lambda: {},
+        "ridealong start": lambda: {},
+        "ridealong roster": lambda: {},
+        "ridealong close": ride_along,
+        "config show": lambda: {},
+        "config role": lambda: {"setting": app_commands.Choice(name="Trainee role", value="trainee_role"), "role": low},
+        "config channel": lambda: {
+            "setting": app_commands.Choice(name="Moderation log", value="mod_log_channel"),
+            "channel": guild.get_channel(2),
+        },
+        "config reset": lambda: {"setting": app_commands.Choice(name="Moderation log", value="mod_log_channel")},
+    }
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+
+async def run_command(h: OfflineBot, name: str, make_args, calls: int, concurrency: int):
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one():
+        nonlocal failures
+        async with sem:
+            kwargs = make_args()
+            start = time.perf_counter()
+            interaction = await h.invoke(name, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if not interaction.response.is_done() or any(
+                isinstance(r, str) and r.startswith(("❌", "⚠️")) for r in interaction.replies
+            ):
+                failures += 1
+
+    # Allocation profile from a separate sequential pass
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(min(calls, 20)):
+        await h.invoke(name, **make_args())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    alloc_blocks = sum(max(s.count_diff, 0) for s in stats) / min(calls, 20)
+    alloc_bytes = sum(max(s.size_diff, 0) for s in stats) / min(calls, 20)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "command": name,
+        "throughput": calls / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "alloc_blocks": alloc_blocks,
+        "alloc_kib": alloc_bytes / 1024,
+        "failures": failures,
+    }
+
+
+async def main(args):
+    results = []
+    async with OfflineBot(rest_latency=args.rest_latency_ms / 1000) as h:
+        table = scenarios(h)
+        missing = {
+            c.qualified_name for c in h.bot.tree.walk_commands() if not isinstance(c, app_commands.Group)
+        } - set(table)
+        if missing:
+            print(f"warning: no scenario for {', '.join(sorted(missing))}")
+        for name, make_args in table.items():
+            if args.only and name not in args.only:
+                continue
+            if h.command(name) is None:
+                print(f"skipping /{name}: not registered")
+                continue
+            results.append(await run_command(h, name, make_args, args.calls, args.concurrency))
+
+    print(f"{'command':<16}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'blocks/call':>13}{'KiB/call':>10}{'fail':>6}")
+    for r in results:
+        print(
+            f"/{r['command']:<15}{r['throughput']:>10.0f}{r['p50'] * 1000:>10.2f}{r['p99'] * 1000:>10.2f}"
+            f"{r['alloc_blocks']:>13.0f}{r['alloc_kib']:>10.1f}{r['failures']:>6}"
+        )
+
+    if args.max_p99_ms is not None:
+        slow = [r["command"] for r in results if r["p99"] * 1000 > args.max_p99_ms]
+        if slow:
+            print(f"p99 over {args.max_p99_ms} ms: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rest-latency-ms", type=float, default=0.0)
+    parser.add_argument("--only", nargs="*", help="Limit to these command names")
+    parser.add_argument("--max-p99-ms", type=float, default=None)
+    sys.exit(asyncio.run(main(parser.parse_args())))
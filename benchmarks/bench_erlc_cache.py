@@ -0,0 +1,90 @@
+"""Waves of concurrent /erlc status reads, direct versus through ERLCReadCache.
+
+Each wave fires --staff concurrent status reads against a local stub that
+takes --latency-ms per request and counts how many reach it:
+
+    python benchmarks/bench_erlc_cache.py --staff 20 --waves 30 --interval 1 --ttl 5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from erlc_cache import ERLCReadCache  # noqa: E402
+from erlc_client import ERLCClient  # noqa: E402
+
+
+class CountingStub:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.requests = 0
+
+    async def server(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response({"Name": "Bench", "CurrentPlayers": 12, "MaxPlayers": 40, "JoinKey": "bench"})
+
+
+async def start_stub(stub: CountingStub):
+    app = web.Application()
+    app.router.add_get("/v1/server", stub.server)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+async def drive(label, read, stub, staff, waves, interval):
+    latencies = []
+
+    async def one():
+        start = time.perf_counter()
+        await read()
+        latencies.append(time.perf_counter() - start)
+
+    for _ in range(waves):
+        await asyncio.gather(*(one() for _ in range(staff)))
+        await asyncio.sleep(interval)
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{label:<8} {len(latencies)} reads   upstream {stub.requests:5}   "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms   p99 {p99 * 1000:7.2f} ms"
+    )
+
+
+async def main(args):
+    for label in ("direct", "cached"):
+        stub = CountingStub(args.latency_ms / 1000)
+        runner, base_url = await start_stub(stub)
+        try:
+            async with ERLCClient("bench", base_url) as client:
+                if label == "direct":
+                    read = client.server_status
+                else:
+                    cache = ERLCReadCache(client, ttl=args.ttl, stale_ttl=args.ttl * 10)
+                    read = cache.status
+                await drive(label, read, stub, args.staff, args.waves, args.interval)
+                if label == "cached":
+                    await cache.close()
+        finally:
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--staff", type=int, default=20)
+    parser.add_argument("--waves", type=int, default=30)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--ttl", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, default=150)
+    args = parser.parse_args()
+    asyncio.run(main(args))
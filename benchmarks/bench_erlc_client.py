@@ -0,0 +1,85 @@
+"""Compare per-call aiohttp sessions with the pooled ERLCClient.
+
+Runs against a local stub of the ER:LC command endpoint:
+
+    python benchmarks/bench_erlc_client.py --requests 500 --concurrency 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from erlc_client import ERLCClient  # noqa: E402
+
+
+async def start_stub(port: int = 0):
+    async def command(request):
+        await request.json()
+        return web.json_response({"message": "Success"})
+
+    app = web.Application()
+    app.router.add_post("/v1/server/command", command)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+async def per_call_session(base_url: str, command: str):
+    # Mirrors the old /erlc handler: a fresh session for every command
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            f"{base_url}/server/command",
+            json={"command": command},
+            headers={"Server-Key": "bench", "Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as response:
+            await response.text()
+            return response.status
+
+
+async def drive(label, call, total, concurrency):
+    latencies = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with sem:
+            start = time.perf_counter()
+            await call(f":h bench {i}")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{label:<18} {total / elapsed:9.1f} req/s   "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms   p99 {p99 * 1000:7.2f} ms"
+    )
+
+
+async def main(total: int, concurrency: int):
+    runner, base_url = await start_stub()
+    try:
+        await drive("per-call session", lambda c: per_call_session(base_url, c), total, concurrency)
+        async with ERLCClient("bench", base_url, max_connections=concurrency) as client:
+            await drive("pooled client", client.run_command, total, concurrency)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
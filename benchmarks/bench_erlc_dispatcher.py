@@ -0,0 +1,108 @@
+"""Burst of /erlc commands against a rate-limited ER:LC stub.
+
+The stub allows --limit commands per --window seconds and answers with the
+same X-RateLimit-* headers and 429 body as the real API.
+
+    python benchmarks/bench_erlc_dispatcher.py --commands 60 --unique 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from erlc_client import ERLCClient  # noqa: E402
+from erlc_dispatcher import CommandDispatcher  # noqa: E402
+
+
+class RateLimitedStub:
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.reset_at = time.time() + window
+        self.used = 0
+        self.accepted = 0
+        self.rejected = 0
+
+    async def command(self, request):
+        await request.json()
+        now = time.time()
+        if now >= self.reset_at:
+            self.reset_at = now + self.window
+            self.used = 0
+        headers = {
+            "X-RateLimit-Bucket": "command",
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Reset": f"{self.reset_at:.3f}",
+        }
+        if self.used >= self.limit:
+            self.rejected += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            return web.json_response(
+                {"code": 4001, "message": "You are being rate limited!", "retry_after": self.reset_at - now},
+                status=429,
+                headers=headers,
+            )
+        self.used += 1
+        self.accepted += 1
+        headers["X-RateLimit-Remaining"] = str(self.limit - self.used)
+        return web.json_response({"message": "Success"}, headers=headers)
+
+
+async def start_stub(stub: RateLimitedStub):
+    app = web.Application()
+    app.router.add_post("/v1/server/command", stub.command)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+def report(label, stub, results, elapsed):
+    executed = sum(1 for r in results if r.ok)
+    print(
+        f"{label:<12} {len(results)} commands in {elapsed:6.2f}s   "
+        f"succeeded {executed:4}   upstream ok {stub.accepted:4}   upstream 429 {stub.rejected:4}   "
+        f"{executed / elapsed:7.1f} cmd/s"
+    )
+
+
+async def main(total: int, unique: int, limit: int, window: float):
+    commands = [f":h burst {i % unique}" for i in range(total)]
+
+    stub = RateLimitedStub(limit, window)
+    runner, base_url = await start_stub(stub)
+    try:
+        async with ERLCClient("bench", base_url) as client:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(client.run_command(c) for c in commands))
+            report("direct", stub, results, time.perf_counter() - start)
+    finally:
+        await runner.cleanup()
+
+    stub = RateLimitedStub(limit, window)
+    runner, base_url = await start_stub(stub)
+    try:
+        async with ERLCClient("bench", base_url) as client:
+            dispatcher = CommandDispatcher(client, max_retries=10)
+            start = time.perf_counter()
+            results = await asyncio.gather(*(dispatcher.submit(c) for c in commands))
+            report("dispatcher", stub, results, time.perf_counter() - start)
+            await dispatcher.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=60)
+    parser.add_argument("--unique", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--window", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.commands, args.unique, args.limit, args.window))
@@ -0,0 +1,123 @@
+"""Ingest throughput of the ER:LC log relay against a high-volume stub.
+
+The stub emits --rate entries per minute into each of the join, kill and
+command logs and, like the real API, returns only the last --window seconds
+on every poll. Embeds go to a writer that takes --send-latency-ms per embed,
+standing in for a rate-limited Discord channel. Halfway through, the relay
+is stopped and a fresh one resumes from the persisted cursors, so any
+duplicate or missing entry across a restart shows up in the totals.
+
+    python benchmarks/bench_erlc_relay.py --rate 3000 --duration 20
+"""
+import argparse
+import asyncio
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from erlc_client import ERLCClient  # noqa: E402
+from erlc_relay import LogRelay  # noqa: E402
+
+SEQ = re.compile(r"\*\*P(\d+)\*\*")
+
+
+class LogStub:
+    def __init__(self, rate_per_minute: float, window: float):
+        self.per_second = rate_per_minute / 60
+        self.window = window
+        self.started = time.time()
+        self.requests = 0
+
+    def _entries(self, shape):
+        now = time.time()
+        first = max(int((now - self.window - self.started) * self.per_second), 0)
+        last = int((now - self.started) * self.per_second)
+        return [shape(seq, int(self.started + seq / self.per_second)) for seq in range(first, last)]
+
+    def route(self, shape):
+        async def handler(request):
+            self.requests += 1
+            return web.json_response(self._entries(shape))
+        return handler
+
+    def created_between(self, start: float, end: float) -> range:
+        return range(int((start - self.started) * self.per_second) + 1, int((end - self.started) * self.per_second))
+
+
+async def start_stub(stub: LogStub):
+    app = web.Application()
+    app.router.add_get("/v1/server/joinlogs", stub.route(
+        lambda seq, ts: {"Join": True, "Timestamp": ts, "Player": f"P{seq}:{seq}"}))
+    app.router.add_get("/v1/server/killlogs", stub.route(
+        lambda seq, ts: {"Killed": f"V{seq}:1", "Timestamp": ts, "Killer": f"P{seq}:{seq}"}))
+    app.router.add_get("/v1/server/commandlogs", stub.route(
+        lambda seq, ts: {"Player": f"P{seq}:{seq}", "Timestamp": ts, "Command": ":h bench"}))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+class SlowWriter:
+    """EmbedWriter stand-in recording which entries reached each channel"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.embeds = 0
+        self.seen = {}
+
+    async def send(self, channel_id: int, embed):
+        await asyncio.sleep(self.latency)
+        self.embeds += 1
+        self.seen.setdefault(channel_id, Counter()).update(int(s) for s in SEQ.findall(embed.description))
+
+
+async def main(args):
+    channels = {"join": 1, "kill": 2, "command": 3}
+    stub = LogStub(args.rate, args.window)
+    writer = SlowWriter(args.send_latency_ms / 1000)
+    runner, base_url = await start_stub(stub)
+    tmp = tempfile.TemporaryDirectory()
+    cursor_path = os.path.join(tmp.name, "cursors.json")
+    try:
+        async with ERLCClient("bench", base_url) as client:
+            start = time.time()
+            for _ in range(2):
+                relay = LogRelay(client, writer, channels, cursor_path=cursor_path, interval=args.interval)
+                await relay.start()
+                await asyncio.sleep(args.duration / 2)
+                await relay.close()
+            elapsed = time.time() - start
+    finally:
+        await runner.cleanup()
+        tmp.cleanup()
+
+    # Entries created after the first poll and at least one interval before the end must all arrive
+    expected = stub.created_between(start + 1, start + elapsed - args.interval - 1)
+    print(f"{'log':<8}{'relayed':>9}{'entries/s':>11}{'dupes':>7}{'missing':>9}")
+    for name, channel_id in channels.items():
+        seen = writer.seen.get(channel_id, Counter())
+        relayed = sum(seen.values())
+        dupes = sum(n - 1 for n in seen.values() if n > 1)
+        missing = sum(1 for seq in expected if seq not in seen)
+        print(f"{name:<8}{relayed:>9}{relayed / elapsed:>11.1f}{dupes:>7}{missing:>9}")
+    print(f"{stub.requests} polls, {writer.embeds} embeds in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=3000, help="Entries per minute per log")
+    parser.add_argument("--window", type=float, default=60, help="Seconds of history per response")
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--send-latency-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args))
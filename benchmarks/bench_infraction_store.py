@@ -0,0 +1,78 @@
+"""Insert and query throughput of InfractionStore at ~1M records.
+
+    python benchmarks/bench_infraction_store.py --records 1000000 --queries 5000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from infraction_store import InfractionStore, ModAction  # noqa: E402
+
+PUNISHMENTS = ["Kick", "Ban", "Warning", "Strike", "Demotion", "Staff Blacklist + Demotion"]
+
+
+async def main(records: int, users: int, queries: int, batch: int):
+    rng = random.Random(1)
+    guild_id = 1320949220114432030
+    base_time = time.time() - 365 * 86400
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = InfractionStore(os.path.join(tmp, "bench.db"))
+        await store.open()
+
+        start = time.perf_counter()
+        for offset in range(0, records, batch):
+            await store.add_many(
+                ModAction(
+                    guild_id=guild_id,
+                    user_id=rng.randrange(users),
+                    moderator_id=rng.randrange(50),
+                    punishment=rng.choice(PUNISHMENTS),
+                    reason="bench",
+                    created_at=base_time + offset + i,
+                )
+                for i in range(min(batch, records - offset))
+            )
+        elapsed = time.perf_counter() - start
+        print(f"bulk insert   {records:>9} rows  {records / elapsed:12.0f} rows/s")
+
+        start = time.perf_counter()
+        for i in range(1000):
+            await store.add(ModAction(guild_id, rng.randrange(users), 1, "Warning", "single"))
+        elapsed = time.perf_counter() - start
+        print(f"single insert {1000:>9} rows  {1000 / elapsed:12.0f} rows/s")
+
+        latencies = []
+        for _ in range(queries):
+            t = time.perf_counter()
+            await store.history(guild_id, rng.randrange(users), 10)
+            latencies.append(time.perf_counter() - t)
+        latencies.sort()
+        print(
+            f"history()     {queries:>9} q     {queries / sum(latencies):12.0f} q/s   "
+            f"p50 {latencies[len(latencies) // 2] * 1000:.3f} ms   "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms"
+        )
+
+        start = time.perf_counter()
+        for _ in range(queries // 10):
+            await store.by_punishment(guild_id, rng.choice(PUNISHMENTS), since=time.time() - 30 * 86400)
+        elapsed = time.perf_counter() - start
+        print(f"by_punishment {queries // 10:>9} q     {queries // 10 / elapsed:12.0f} q/s")
+
+        await store.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.records, args.users, args.queries, args.batch))
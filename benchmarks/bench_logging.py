@@ -0,0 +1,98 @@
+"""Event-loop stall under heavy logging: print() versus the queued logging pipeline.
+
+Writes go to a stream that blocks for --write-latency-ms per write, like a
+container log pipe that has backed up. A probe task measures how late the
+loop wakes it up while --tasks coroutines each emit --lines records.
+
+    python benchmarks/bench_logging.py --tasks 20 --lines 200 --write-latency-ms 0.5
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from logs import setup_logging  # noqa: E402
+
+
+class SlowStream:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.writes = 0
+        self.lines = 0
+
+    def write(self, text: str):
+        time.sleep(self.latency)
+        self.writes += 1
+        self.lines += text.count("\n")
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+async def probe(lags: list, stop: asyncio.Event, tick: float = 0.001):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(tick)
+        lags.append(max(time.perf_counter() - start - tick, 0))
+
+
+async def run(label, emit, args, drain=None):
+    lags = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(0.01)
+
+    async def worker(n):
+        for i in range(args.lines):
+            emit(n, i)
+            # Yield like a real handler between records
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(args.tasks)))
+    emitted = time.perf_counter() - start
+    stop.set()
+    await prober
+    drained = time.perf_counter()
+    if drain is not None:
+        drain()
+    drained = time.perf_counter() - drained
+
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{label:<16}{emitted * 1000:>10.1f}{max(lags) * 1000:>10.2f}{p99 * 1000:>10.2f}"
+        f"{sum(lags) * 1000:>12.1f}{drained * 1000:>10.1f}"
+    )
+
+
+async def main(args):
+    latency = args.write_latency_ms / 1000
+    print(f"{'mode':<16}{'emit ms':>10}{'max lag':>10}{'p99 lag':>10}{'stall ms':>12}{'drain ms':>10}")
+
+    stream = SlowStream(latency)
+    await run("print", lambda n, i: print(f"task {n} line {i} assigned role", file=stream), args)
+
+    stream = SlowStream(latency)
+    listener = setup_logging(stream=stream, fmt="json")
+    log = logging.getLogger("bench")
+    await run("logging json", lambda n, i: log.info("task %d line %d assigned role", n, i), args, listener.stop)
+
+    # Identical errors are rate limited, so the pipe sees a handful instead of every one
+    stream = SlowStream(latency)
+    listener = setup_logging(stream=stream, fmt="json")
+    await run("logging errors", lambda n, i: log.warning("Failed to assign auto-role to %s", n), args, listener.stop)
+    print(f"{args.tasks * args.lines} repeated warnings -> {stream.lines} lines written")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--write-latency-ms", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args))
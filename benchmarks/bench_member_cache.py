@@ -0,0 +1,126 @@
+"""Startup cost and memory of each MEMBER_CACHE_MODE at synthetic guild sizes.
+
+Each (mode, size) runs in its own interpreter. It builds a discord.Guild and
+turns a GUILD_MEMBERS_CHUNK-shaped payload into discord.Member objects the
+way the gateway would, keeping them according to the mode:
+
+  full  every member is cached on the guild (startup chunking)
+  lazy  only members seen in events are cached (--active fraction)
+  lru   members pass through; only the MemberLRU keeps the last --lru-size
+
+    python benchmarks/bench_member_cache.py --sizes 10000 100000 500000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_mb() -> float:
+    import resource  # Unix only; the benchmark doesn't run on Windows
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports ru_maxrss in bytes, Linux in KiB
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def member_payload(i: int, role_ids) -> dict:
+    return {
+        "user": {
+            "id": str(10**17 + i),
+            "username": f"member{i}",
+            "discriminator": "0",
+            "global_name": None,
+            "avatar": None,
+        },
+        "roles": [role_ids[i % len(role_ids)]],
+        "joined_at": "2025-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def run_one(mode: str, size: int, active: float, lru_size: int) -> dict:
+    sys.path.insert(0, ROOT)
+    import discord
+    from discord.state import ConnectionState
+    from member_cache import MemberLRU, client_options
+
+    intents = discord.Intents.default()
+    intents.members = True
+    options = client_options(mode, intents)
+    state = ConnectionState(
+        dispatch=lambda *a, **k: None,
+        handlers={},
+        hooks={},
+        http=None,
+        intents=intents,
+        **options,
+    )
+    role_ids = [str(2 * 10**17 + r) for r in range(50)]
+    guild = discord.Guild(
+        data={
+            "id": "1",
+            "name": "bench",
+            "member_count": size,
+            "roles": [{"id": rid, "name": f"r{n}", "position": n, "permissions": "0", "color": 0,
+                       "hoist": False, "managed": False, "mentionable": False}
+                      for n, rid in enumerate(role_ids)],
+        },
+        state=state,
+    )
+    lru = MemberLRU(lru_size)
+    keep_every = max(1, round(1 / active)) if active > 0 else None
+
+    baseline = rss_mb()
+    start = time.perf_counter()
+    for i in range(size):
+        member = discord.Member(data=member_payload(i, role_ids), guild=guild, state=state)
+        if mode == "full":
+            guild._add_member(member)
+        elif mode == "lazy":
+            if keep_every and i % keep_every == 0:
+                guild._add_member(member)
+        else:
+            lru.remember(member)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "size": size,
+        "seconds": elapsed,
+        "cached": len(guild._members) + len(lru),
+        "rss_mb": rss_mb() - baseline,
+    }
+
+
+def main(args):
+    print(f"{'mode':<6}{'members':>10}{'cached':>10}{'load s':>10}{'RSS +MB':>10}")
+    for size in args.sizes:
+        for mode in args.modes:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(size),
+                 "--active", str(args.active), "--lru-size", str(args.lru_size)],
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{r['mode']:<6}{r['size']:>10}{r['cached']:>10}{r['seconds']:>10.2f}{r['rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--modes", nargs="+", default=["full", "lazy", "lru"])
+    parser.add_argument("--active", type=float, default=0.02, help="Fraction of members seen in events (lazy)")
+    parser.add_argument("--lru-size", type=int, default=5000)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        mode, size = args.child
+        print(json.dumps(run_one(mode, int(size), args.active, args.lru_size)))
+    else:
+        main(args)
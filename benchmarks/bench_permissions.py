@@ -0,0 +1,84 @@
+"""Cost of a command permission check with and without the permission engine.
+
+Builds a synthetic guild with many roles and members, then times the old
+set-intersection check plus ad hoc top_role comparison against
+PermissionEngine checks.
+
+    python benchmarks/bench_permissions.py --roles 5000 --members 50000 --roles-per-member 20
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from permissions import Capability, PermissionEngine, compile_roles  # noqa: E402
+
+
+class Role:
+    __slots__ = ("id", "position")
+
+    def __init__(self, role_id, position):
+        self.id = role_id
+        self.position = position
+
+
+class Guild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+
+
+class Member:
+    def __init__(self, guild, member_id, roles):
+        self.guild = guild
+        self.id = member_id
+        self.roles = roles
+
+    @property
+    def top_role(self):
+        # discord.Member.top_role scans every role the same way
+        return max(self.roles, key=lambda r: r.position)
+
+
+def timed(label, fn, members, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for member in members:
+            fn(member)
+    elapsed = time.perf_counter() - start
+    calls = repeat * len(members)
+    print(f"{label:<32} {elapsed / calls * 1e9:9.0f} ns/check   {calls / elapsed:12.0f} checks/s")
+
+
+def main(n_roles, n_members, per_member, repeat):
+    rng = random.Random(7)
+    guild = Guild(1)
+    roles = [Role(10**17 + i, i) for i in range(n_roles)]
+    allowed = {r.id for r in rng.sample(roles, 3)}
+    members = [Member(guild, i, sorted(rng.sample(roles, per_member), key=lambda r: r.position)) for i in range(n_members)]
+    bot = Member(guild, -1, [roles[-1]])
+
+    def legacy(member):
+        # is_allowed() + hierarchy check as the handlers used to do it
+        ok = bool({role.id for role in member.roles}.intersection(allowed))
+        return ok and member.top_role.position < bot.top_role.position
+
+    engine = PermissionEngine(compile_roles({Capability.STAFF: allowed}))
+
+    def compiled(member):
+        return engine.has(member, Capability.STAFF) and engine.outranks(bot, member)
+
+    print(f"{n_roles} roles, {n_members} members, {per_member} roles each")
+    timed("legacy set+top_role", legacy, members, repeat)
+    timed("engine", compiled, members, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roles", type=int, default=5000)
+    parser.add_argument("--members", type=int, default=50000)
+    parser.add_argument("--roles-per-member", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.roles, args.members, args.roles_per_member, args.repeat)
@@ -0,0 +1,60 @@
+"""Cold-start import time of each command extension and hot-reload latency.
+
+Needs no Discord connection; extensions are loaded into an offline bot.
+
+    python benchmarks/bench_startup.py --reloads 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+
+def cold_import(module: str) -> float:
+    # A fresh interpreter per module so nothing is already in sys.modules
+    code = (
+        "import time; s = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - s)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+async def reload_latency(reloads: int):
+    from bot_commands import EXTENSIONS
+    from harness import OfflineBot
+
+    # The offline bot provides the mod log, stores and config the cogs expect
+    async with OfflineBot() as h:
+        for name in EXTENSIONS:
+            samples = []
+            for _ in range(reloads):
+                start = time.perf_counter()
+                await h.bot.reload_extension(name)
+                samples.append(time.perf_counter() - start)
+            print(f"reload {name:<22} median {statistics.median(samples) * 1000:7.2f} ms   max {max(samples) * 1000:7.2f} ms")
+
+
+def main(reloads: int):
+    from bot_commands import EXTENSIONS
+
+    print(f"import {'discord':<22} {cold_import('discord') * 1000:7.1f} ms (baseline)")
+    for module in ["bot_commands", *EXTENSIONS]:
+        print(f"import {module:<22} {cold_import(module) * 1000:7.1f} ms")
+    asyncio.run(reload_latency(reloads))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reloads", type=int, default=20)
+    args = parser.parse_args()
+    main(args.reloads)
@@ -0,0 +1,359 @@
+"""Offline fakes for driving the slash command handlers without Discord.
+
+The fakes implement just the attributes and coroutines the cogs touch.
+Every REST-style coroutine sleeps for ``rest_latency`` seconds so handlers
+see realistic awaits, and counts itself in ``FakeGuild.rest_calls``.
+"""
+import asyncio
+import itertools
+import os
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+import discord
+from aiohttp import web
+from discord.ext import commands
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+_ids = itertools.count(10**17)
+
+
+class FakeRole:
+    def __init__(self, guild: "FakeGuild", role_id: Optional[int] = None, position: int = 1, name: str = "role"):
+        self.guild = guild
+        self.id = role_id or next(_ids)
+        self.position = position
+        self.name = name
+        self.mention = f"<@&{self.id}>"
+
+    def __eq__(self, other):
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeTextChannel", content=None, embeds=None):
+        self.id = next(_ids)
+        self.channel = channel
+        self.guild = channel.guild
+        self.content = content
+        self.embeds = embeds or []
+        self.reactions: List[str] = []
+        self.jump_url = f"https://discord.com/channels/{self.guild.id}/{channel.id}/{self.id}"
+
+    async def add_reaction(self, emoji):
+        await self.guild.rest()
+        self.reactions.append(str(emoji))
+
+    async def edit(self, **kwargs):
+        await self.guild.rest()
+        if "content" in kwargs:
+            self.content = kwargs["content"]
+        if "embed" in kwargs:
+            self.embeds = [kwargs["embed"]]
+
+
+class FakeTextChannel:
+    def __init__(self, guild: "FakeGuild", channel_id: Optional[int] = None, name: str = "channel"):
+        self.guild = guild
+        self.id = channel_id or next(_ids)
+        self.name = name
+        self.mention = f"<#{self.id}>"
+        self.sent: List[FakeMessage] = []
+
+    def permissions_for(self, member):
+        return discord.Permissions.all()
+
+    async def send(self, content=None, *, embed=None, embeds=None, **kwargs):
+        await self.guild.rest()
+        message = FakeMessage(self, content, [embed] if embed is not None else embeds)
+        self.sent.append(message)
+        return message
+
+
+class FakeMember:
+    def __init__(self, guild: "FakeGuild", roles: List[FakeRole], name: str = "member", member_id: Optional[int] = None):
+        self.guild = guild
+        self.id = member_id or next(_ids)
+        self.name = name
+        self.display_name = name
+        self.nick = None
+        self.mention = f"<@{self.id}>"
+        self.bot = False
+        self.joined_at = discord.utils.utcnow()
+        self.roles = [guild.default_role, *roles]
+        self.guild_permissions = discord.Permissions.all()
+
+    @property
+    def top_role(self) -> FakeRole:
+        return max(self.roles, key=lambda r: r.position)
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    async def add_roles(self, *roles, reason=None):
+        await self.guild.rest()
+        self.roles.extend(r for r in roles if r not in self.roles)
+
+    async def remove_roles(self, *roles, reason=None):
+        await self.guild.rest()
+        self.roles = [r for r in self.roles if r not in roles]
+
+    async def edit(self, *, nick=None, **kwargs):
+        await self.guild.rest()
+        self.nick = nick
+
+    async def kick(self, *, reason=None):
+        await self.guild.rest()
+
+    async def ban(self, *, reason=None, delete_message_days=0, **kwargs):
+        await self.guild.rest()
+
+
+class FakeGuild:
+    """Guild whose channels and roles are created on first lookup"""
+
+    def __init__(self, rest_latency: float = 0.0):
+        self.id = next(_ids)
+        self.name = "Harness Guild"
+        self.rest_latency = rest_latency
+        self.rest_calls = 0
+        self.default_role = FakeRole(self, self.id, position=0, name="@everyone")
+        self._roles: Dict[int, FakeRole] = {self.id: self.default_role}
+        self._channels: Dict[int, FakeTextChannel] = {}
+        self.members: List[FakeMember] = []
+        self.chunked = True
+        self.owner_id = None
+        self.me = FakeMember(self, [FakeRole(self, position=1000, name="Bot")], name="DCBot")
+
+    async def rest(self):
+        self.rest_calls += 1
+        if self.rest_latency:
+            await asyncio.sleep(self.rest_latency)
+
+    def get_role(self, role_id: int) -> FakeRole:
+        role = self._roles.get(role_id)
+        if role is None:
+            role = self._roles[role_id] = FakeRole(self, role_id, position=10)
+        return role
+
+    def get_channel(self, channel_id: int) -> FakeTextChannel:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeTextChannel(self, channel_id)
+        return channel
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return next((m for m in self.members if m.id == member_id), None)
+
+    def add_member(self, roles: List[FakeRole], name: str = "member") -> FakeMember:
+        member = FakeMember(self, roles, name=name)
+        self.members.append(member)
+        return member
+
+    async def query_members(self, query=None, *, limit=5, user_ids=None, cache=True, **kwargs) -> List[FakeMember]:
+        await self.rest()
+        wanted = set(user_ids or ())
+        return [m for m in self.members if m.id in wanted][:limit]
+
+    async def kick(self, user, *, reason=None):
+        await self.rest()
+
+    async def ban(self, user, *, reason=None, delete_message_days=0, **kwargs):
+        await self.rest()
+
+
+class FakeResponse:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def send_message(self, content=None, **kwargs):
+        if self._done:
+            raise discord.InteractionResponded(self._interaction)
+        await self._interaction.guild.rest()
+        self._done = True
+        self._interaction.replies.append(content if content is not None else kwargs.get("embed"))
+
+    async def defer(self, **kwargs):
+        if self._done:
+            raise discord.InteractionResponded(self._interaction)
+        await self._interaction.guild.rest()
+        self._done = True
+
+
+class FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        await self._interaction.guild.rest()
+        self._interaction.replies.append(content if content is not None else kwargs.get("embed"))
+
+
+class FakeInteraction:
+    def __init__(self, client, guild: FakeGuild, user: FakeMember, channel: Optional[FakeTextChannel] = None):
+        self.id = next(_ids)
+        self.client = client
+        self.guild = guild
+        self.guild_id = guild.id
+        self.user = user
+        self.channel = channel or guild.get_channel(next(_ids))
+        self.permissions = discord.Permissions.all()
+        self.type = discord.InteractionType.application_command
+        self.command = None
+        self.data: dict = {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.replies: list = []
+
+    async def edit_original_response(self, *, content=None, **kwargs):
+        await self.guild.rest()
+        self.original_response = content
+
+
+# ======================
+# ER:LC STUB
+# ======================
+
+async def start_erlc_stub(latency: float = 0.0):
+    """Local stand-in for the ER:LC API; returns (runner, base_url)"""
+    async def command(request):
+        await request.json()
+        if latency:
+            await asyncio.sleep(latency)
+        return web.json_response({"message": "Success"}, headers={"X-RateLimit-Remaining": "100"})
+
+    def read(payload):
+        async def handler(request):
+            if latency:
+                await asyncio.sleep(latency)
+            return web.json_response(payload, headers={"X-RateLimit-Remaining": "100"})
+        return handler
+
+    players = [
+        {"Player": f"Player{i}:{1000 + i}", "Permission": "Normal", "Callsign": None,
+         "Team": ("Civilian", "Police", "Sheriff", "Fire")[i % 4]}
+        for i in range(30)
+    ]
+    status = {"Name": "Harness", "OwnerId": 1, "CurrentPlayers": len(players), "MaxPlayers": 40,
+              "JoinKey": "harness", "AccVerifiedReq": "Disabled", "TeamBalance": True}
+
+    app = web.Application()
+    app.router.add_post("/v1/server/command", command)
+    app.router.add_get("/v1/server", read(status))
+    app.router.add_get("/v1/server/players", read(players))
+    app.router.add_get("/v1/server/queue", read([2000, 2001, 2002]))
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+# ======================
+# OFFLINE BOT
+# ======================
+
+class OfflineBot:
+    """A commands.Bot with every extension loaded and no gateway connection"""
+
+    def __init__(self, rest_latency: float = 0.0):
+        self.rest_latency = rest_latency
+        self.tmp = tempfile.TemporaryDirectory()
+
+    async def __aenter__(self):
+        from bot_commands import (
+            ALLOWED_ROLE_IDS, DEFAULT_SETTINGS, HOME_SETTINGS, TRAINER_ROLE_ID, load_extensions, watch_guild_config
+        )
+        from embed_writer import EmbedWriter
+        from guild_config import GuildConfigStore
+        from infraction_store import InfractionStore
+        from instrumentation import InstrumentedTree
+        from sqlite_store import Database
+
+        self.bot = bot = commands.Bot(command_prefix="!", intents=discord.Intents.default(), tree_cls=InstrumentedTree)
+        # FakeResponse is not a discord.InteractionResponse, so the watchdog's
+        # defer can't reach it; timing and REST bookkeeping still run
+        bot.tree.defer_budget = None
+        self.guild = FakeGuild(self.rest_latency)
+        bot.get_channel = self.guild.get_channel
+
+        async def role_route(guild_id, user_id, role_id, *, reason=None):
+            await self.guild.rest()
+
+        bot.http.add_role = bot.http.remove_role = role_route
+        bot.mod_log = EmbedWriter(bot, flush_interval=0.05, min_send_interval=0)
+        # Keep state files in the temp dir, away from a live bot's backlog
+        bot.autorole_backlog_path = os.path.join(self.tmp.name, "autorole_backlog.json")
+        db = Database(os.path.join(self.tmp.name, "harness.db"))
+        bot.infractions = InfractionStore(db)
+        await bot.infractions.open()
+        # The fake guild stands in for the home guild, so the built-in IDs apply
+        bot.config = GuildConfigStore(db, DEFAULT_SETTINGS, guild_defaults={self.guild.id: HOME_SETTINGS})
+        await bot.config.open()
+        watch_guild_config(bot.config)
+
+        self.erlc_runner, erlc_url = await start_erlc_stub(self.rest_latency)
+        await load_extensions(bot)
+        bot.get_cog("ERLC").client.base_url = erlc_url
+        # Every call re-announces; the load test isn't a double post
+        bot.get_cog("Announcements").announcer.dedupe_window = 0
+
+        staff_roles = [self.guild.get_role(role_id) for role_id in (*ALLOWED_ROLE_IDS, TRAINER_ROLE_ID)]
+        for role in staff_roles:
+            role.position = 100
+        self.staff = self.guild.add_member(staff_roles, name="Staff")
+        return self
+
+    async def __aexit__(self, *exc):
+        # Same order as DCBot.close: cogs, then the writer and stores they use
+        for extension in tuple(self.bot.extensions):
+            await self.bot.unload_extension(extension)
+        await self.bot.mod_log.close()
+        await self.bot.infractions.close()
+        await self.bot.config.close()
+        await self.bot.close()
+        await self.erlc_runner.cleanup()
+        self.tmp.cleanup()
+
+    def command(self, name: str):
+        """Look up a command by qualified name, e.g. "erlc run" """
+        parent, *children = name.split()
+        command = self.bot.tree.get_command(parent)
+        for child in children:
+            command = command.get_command(child) if command is not None else None
+        return command
+
+    def interaction(self) -> FakeInteraction:
+        return FakeInteraction(self.bot, self.guild, self.staff)
+
+    async def invoke(self, name: str, **params) -> FakeInteraction:
+        """Run a command's checks and callback the way the tree would"""
+        command = self.command(name)
+        interaction = self.interaction()
+        interaction.command = command
+        interaction.data = {"name": command.name}
+        tree = self.bot.tree
+        await tree.interaction_check(interaction)
+        try:
+            for check in command.checks:
+                if not await discord.utils.maybe_coroutine(check, interaction):
+                    tree._finish(interaction, "denied")
+                    return interaction
+            await command.callback(command.binding, interaction, **params)
+        except Exception:
+            tree._finish(interaction, "error")
+            raise
+        tree._finish(interaction, "ok")
+        return interaction
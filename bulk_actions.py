@@ -0,0 +1,289 @@
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Awaitable, Callable, List, Optional, Sequence, Set, Tuple
+
+import discord
+
+from member_cache import MEMBERS, all_members
+from permissions import ENGINE
+
+MAX_TARGETS = 1000
+# user_ids per gateway member request (Discord's limit)
+QUERY_CHUNK = 100
+ID_PATTERN = re.compile(r"\d{15,20}")
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one bulk run"""
+    succeeded: List[discord.abc.Snowflake] = field(default_factory=list)
+    failed: List[Tuple[discord.abc.Snowflake, str]] = field(default_factory=list)
+    skipped: List[Tuple[discord.abc.Snowflake, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return len(self.succeeded) + len(self.failed) + len(self.skipped)
+
+
+def parse_ids(text: Optional[str]) -> List[int]:
+    """Pull user IDs out of a string of mentions and/or raw IDs"""
+    if not text:
+        return []
+    seen: Set[int] = set()
+    ids = []
+    for match in ID_PATTERN.findall(text):
+        user_id = int(match)
+        if user_id not in seen:
+            seen.add(user_id)
+            ids.append(user_id)
+    return ids
+
+
+async def resolve_targets(
+    guild: discord.Guild,
+    ids: Sequence[int],
+    *,
+    joined_within: Optional[int] = None,
+    has_role: Optional[discord.Role] = None,
+    result: Optional[BulkResult] = None,
+    on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+) -> Tuple[List[discord.Member], List[int]]:
+    """Resolve explicit IDs or filter the guild's members
+
+    Returns the matching members and any IDs that are not in the guild.
+    Filters narrow an explicit ID list; without IDs they select from the
+    whole guild. Uncached IDs are looked up over the gateway in chunks of
+    ``QUERY_CHUNK``, awaiting ``on_progress(done, total)`` after each; a
+    chunk that times out is added to ``result.failed`` instead.
+    """
+    missing: List[int] = []
+    if ids:
+        members = []
+        uncached = []
+        for user_id in ids:
+            member = MEMBERS.get(guild, user_id)
+            if member is None:
+                uncached.append(user_id)
+            else:
+                members.append(member)
+        for start in range(0, len(uncached), QUERY_CHUNK):
+            chunk = uncached[start:start + QUERY_CHUNK]
+            try:
+                found = {m.id: m for m in await guild.query_members(user_ids=chunk, limit=len(chunk), cache=False)}
+            except asyncio.TimeoutError:
+                if result is not None:
+                    result.failed.extend((discord.Object(id=user_id), "member lookup timed out") for user_id in chunk)
+                continue
+            for user_id in chunk:
+                member = found.get(user_id)
+                if member is None:
+                    missing.append(user_id)
+                else:
+                    MEMBERS.remember(member)
+                    members.append(member)
+            if on_progress is not None:
+                await on_progress(start + len(chunk), len(uncached))
+    elif has_role is not None and guild.chunked:
+        members = list(has_role.members)
+    else:
+        members = await all_members(guild)
+
+    if joined_within is not None:
+        cutoff = discord.utils.utcnow() - timedelta(minutes=joined_within)
+        members = [m for m in members if m.joined_at and m.joined_at >= cutoff]
+    if has_role is not None:
+        members = [m for m in members if m.get_role(has_role.id) is not None]
+    return members, missing
+
+
+async def run_pipeline(
+    targets: Sequence[discord.abc.Snowflake],
+    action: Callable[[discord.abc.Snowflake], Awaitable[None]],
+    *,
+    concurrency: int = 4,
+    on_progress: Optional[Callable[[BulkResult, int], Awaitable[None]]] = None,
+    progress_interval: float = 2.0,
+    max_attempts: int = 3,
+    result: Optional[BulkResult] = None,
+) -> BulkResult:
+    """Run ``action`` for every target with at most ``concurrency`` in flight
+
+    429s and 5xx responses are retried with backoff; ``on_progress`` is
+    awaited at most every ``progress_interval`` seconds and once at the end.
+    Outcomes are added to ``result`` when given (e.g. one holding skips).
+    """
+    result = result if result is not None else BulkResult()
+    total = len(targets) + result.processed
+    queue: asyncio.Queue = asyncio.Queue()
+    for target in targets:
+        queue.put_nowait(target)
+    start = time.perf_counter()
+    last_progress = start
+
+    async def report(final: bool = False):
+        nonlocal last_progress
+        if on_progress is None:
+            return
+        now = time.perf_counter()
+        if final or now - last_progress >= progress_interval:
+            last_progress = now
+            result.elapsed = now - start
+            try:
+                await on_progress(result, total)
+            except discord.HTTPException:
+                pass
+
+    async def worker():
+        while True:
+            try:
+                target = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    await action(target)
+                    result.succeeded.append(target)
+                    break
+                except discord.HTTPException as e:
+                    if (e.status == 429 or e.status >= 500) and attempt < max_attempts:
+                        await asyncio.sleep(getattr(e, "retry_after", None) or 2 ** attempt)
+                        continue
+                    result.failed.append((target, e.text or str(e)))
+                    break
+                except Exception as e:
+                    result.failed.append((target, str(e)))
+                    break
+            await report()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    result.elapsed = time.perf_counter() - start
+    await report(final=True)
+    return result
+
+
+def progress_text(verb: str, result: BulkResult, total: int) -> str:
+    return (
+        f"⏳ {verb}: {result.processed}/{total} "
+        f"(✅ {len(result.succeeded)} · ❌ {len(result.failed)} · ⏭️ {len(result.skipped)}) "
+        f"in {result.elapsed:.1f}s"
+    )
+
+
+def summary_embed(title: str, moderator: discord.abc.User, result: BulkResult, reason: str, color: int) -> discord.Embed:
+    """One mod-log embed for the whole run instead of one per target"""
+    embed = discord.Embed(title=title, color=color)
+    embed.description = f"Run by {moderator.mention} in {result.elapsed:.1f}s"
+    embed.add_field(name="Reason", value=reason[:1024], inline=False)
+    embed.add_field(name="Succeeded", value=str(len(result.succeeded)))
+    embed.add_field(name="Failed", value=str(len(result.failed)))
+    embed.add_field(name="Skipped", value=str(len(result.skipped)))
+    if result.succeeded:
+        mentions = " ".join(f"<@{t.id}>" for t in result.succeeded)
+        if len(mentions) > 1024:
+            mentions = mentions[:1000].rsplit(" ", 1)[0] + " …"
+        embed.add_field(name="Targets", value=mentions, inline=False)
+    if result.failed:
+        errors = "\n".join(f"<@{t.id}>: {err[:80]}" for t, err in result.failed[:10])
+        embed.add_field(name="Errors", value=errors[:1024], inline=False)
+    return embed
+
+
+async def execute(
+    interaction: discord.Interaction,
+    *,
+    verb: str,
+    title: str,
+    color: int,
+    targets: Optional[str],
+    joined_within: Optional[int],
+    has_role: Optional[discord.Role],
+    reason: str,
+    action: Callable[[discord.abc.Snowflake], Awaitable[None]],
+    log_channel_id: Optional[int],
+    check_hierarchy: bool = True,
+    act_on_missing: bool = False,
+    skip_if: Optional[Callable[[discord.Member], Optional[str]]] = None,
+    concurrency: int = 4,
+) -> BulkResult:
+    """Shared flow for /masskick, /massban and /massrole
+
+    With ``act_on_missing`` IDs that are not in the server are still passed
+    to ``action`` as ``discord.Object`` (used to pre-ban raiders who left).
+    ``skip_if`` returns a reason to skip a member without calling the API.
+    """
+    ids = parse_ids(targets)
+    if not ids and joined_within is None and has_role is None:
+        await interaction.response.send_message(
+            "❌ Give member mentions/IDs or at least one filter (joined_within, has_role)!",
+            ephemeral=True
+        )
+        return BulkResult()
+    if len(ids) > MAX_TARGETS:
+        await interaction.response.send_message(
+            f"❌ {len(ids)} IDs given; a run can target at most {MAX_TARGETS}.",
+            ephemeral=True
+        )
+        return BulkResult()
+
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    guild = interaction.guild
+
+    async def on_lookup(done: int, total: int):
+        try:
+            await interaction.edit_original_response(content=f"⏳ Looking up members: {done}/{total}")
+        except discord.HTTPException:
+            pass
+
+    result = BulkResult()
+    members, missing = await resolve_targets(
+        guild, ids, joined_within=joined_within, has_role=has_role, result=result, on_progress=on_lookup
+    )
+    if len(members) > MAX_TARGETS:
+        await interaction.followup.send(
+            f"❌ {len(members)} members matched; narrow the selection to at most {MAX_TARGETS}.",
+            ephemeral=True
+        )
+        return BulkResult()
+
+    runnable = []
+    for member in members:
+        if member.id in (interaction.user.id, guild.me.id) or member.id == guild.owner_id:
+            result.skipped.append((member, "protected"))
+        elif check_hierarchy and not ENGINE.outranks(interaction.user, member):
+            result.skipped.append((member, "equal/higher role than you"))
+        elif check_hierarchy and not ENGINE.outranks(guild.me, member):
+            result.skipped.append((member, "equal/higher role than the bot"))
+        elif skip_if is not None and (skip_reason := skip_if(member)):
+            result.skipped.append((member, skip_reason))
+        else:
+            runnable.append(member)
+    for user_id in missing:
+        if act_on_missing:
+            runnable.append(discord.Object(id=user_id))
+        else:
+            result.skipped.append((discord.Object(id=user_id), "not in server"))
+
+    if not runnable:
+        await interaction.followup.send(
+            f"❌ Nothing to do ({len(result.skipped)} skipped, {len(result.failed)} failed).", ephemeral=True
+        )
+        return result
+
+    async def on_progress(progress: BulkResult, total: int):
+        text = progress_text(verb, progress, total)
+        if progress.processed >= total:
+            text = text.replace("⏳", "✅", 1)
+        await interaction.edit_original_response(content=text)
+
+    # The deferred "thinking" reply is the single message edited with progress
+    await interaction.edit_original_response(content=progress_text(verb, result, len(runnable) + result.processed))
+    await run_pipeline(runnable, action, concurrency=concurrency, on_progress=on_progress, result=result)
+
+    await interaction.client.mod_log.send(
+        log_channel_id, summary_embed(title, interaction.user, result, reason, color), guild_id=interaction.guild.id
+    )
+    return result
@@ -0,0 +1,243 @@
+import asyncio
+import discord
+import logging
+from discord import app_commands
+from discord.ext import commands
+from typing import Iterable, List, Optional
+
+from announcer import Announcer, DuplicateAnnouncement, Target, delivery_report
+from bot_commands import HOME_GUILD_ID, PARTNER_CHANNEL_IDS, is_allowed, is_trainer
+from guild_config import GuildSettings
+from ridealong_tracker import RideAlongTracker, Session
+
+log = logging.getLogger(__name__)
+
+
+def ssu_targets(settings: GuildSettings, partner_channels: Iterable[int] = ()) -> List[Target]:
+    targets = [Target(settings.announcement_channel, settings.notification_role)] if settings.announcement_channel else []
+    return targets + [Target(channel_id, partner=True) for channel_id in sorted(partner_channels)]
+
+
+def ridealong_targets(settings: GuildSettings) -> List[Target]:
+    return [Target(settings.ridealong_channel, settings.trainee_role)] if settings.ridealong_channel else []
+
+
+class Announcements(commands.Cog):
+    """Echo, server startup and ride along announcements"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.announcer = Announcer(bot)
+        self.tracker = RideAlongTracker(on_close=lambda session: asyncio.create_task(self._announce_closed(session)))
+
+    @app_commands.command(name="echo", description="Make the bot repeat a message")
+    @app_commands.describe(
+        message="The message to repeat",
+        channel="Channel to send to (default: current channel)",
+        silent="If true, only you see the confirmation"
+    )
+    @app_commands.checks.has_permissions(manage_messages=True)
+    @is_allowed()
+    async def echo(self, interaction: discord.Interaction, message: str, channel: Optional[discord.TextChannel] = None, silent: bool = False):
+        try:
+            target = channel or interaction.channel
+            if not target.permissions_for(interaction.guild.me).send_messages:
+                return await interaction.response.send_message("❌ I don't have permissions to send messages there!", ephemeral=True)
+            await target.send(message)
+            await interaction.response.send_message(
+                f"✅ Message sent to {target.mention}" + (" (silently)" if silent else ""),
+                ephemeral=silent
+            )
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to send message: {str(e)}", ephemeral=True)
+
+    # ======================
+    # SERVER STARTUP COMMAND
+    # ======================
+    @app_commands.command(name="ssu", description="Announce server startup")
+    @is_allowed()
+    async def ssu(self, interaction: discord.Interaction):
+        """Send server startup announcement"""
+        # Partner channels are operator-configured and only follow the home guild
+        partners = PARTNER_CHANNEL_IDS if interaction.guild.id == HOME_GUILD_ID else ()
+        targets = ssu_targets(self.bot.config.get(interaction.guild.id), partners)
+        if not targets:
+            return await interaction.response.send_message(
+                "❌ No announcement channel configured! Set one with `/config channel`.",
+                ephemeral=True
+            )
+
+        key = ("ssu", interaction.guild.id)
+        try:
+            self.announcer.claim(key)
+        except DuplicateAnnouncement as e:
+            return await interaction.response.send_message(
+                f"⚠️ Server startup was already announced {e.age:.0f}s ago!",
+                ephemeral=True
+            )
+
+        try:
+            embed = discord.Embed(
+                title="🚀 Server Startup Initiated",
+                description="@members The server is now starting up!",
+                color=0x00FF00  # Green color
+            )
+            embed.add_field(
+                name="Status Updates",
+                value="[Click to join server](https://policeroleplay.community/join/NHB)",
+                inline=False
+            )
+            embed.set_footer(text=f"Initiated by {interaction.user.display_name}")
+
+            await interaction.response.send_message(
+                f"📣 Announcing server startup to {len(targets)} channel(s)...",
+                ephemeral=True
+            )
+            deliveries = await self.announcer.announce("ssu", embed, targets, guild_id=interaction.guild.id)
+            if not any(d.ok for d in deliveries):
+                self.announcer.release(key)
+            await interaction.followup.send(delivery_report(deliveries), ephemeral=True)
+
+        except Exception as e:
+            self.announcer.release(key)
+            message = f"❌ Failed to send announcement: {str(e)}"
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
+
+    # ======================
+    # RIDE ALONG COMMAND
+    # ======================
+    ridealong = app_commands.Group(name="ridealong", description="Ride along sessions")
+
+    @ridealong.command(name="start", description="Start a new ride along session")
+    @app_commands.describe(slots="Close sign-ups after this many trainees (default: no limit)")
+    @is_trainer()
+    async def ridealong_start(self, interaction: discord.Interaction, slots: Optional[app_commands.Range[int, 1, 50]] = None):
+        """Create a ride along announcement with trainee ping"""
+        try:
+            import pytz
+            from datetime import datetime
+
+            # Get current time in CST
+            cst = pytz.timezone('America/Chicago')
+            current_time = datetime.now(cst).strftime('%I:%M %p CST')
+            
+            # Create embed with exact formatting
+            embed = discord.Embed(color=0x5865F2)  # Using your server's blue color
+            embed.description = (
+                "**# New Horizons Border Roleplay Ride Along**\n\n"
+                "You must be accepted in the group. If you are go on the sheriff team then "
+                "unequip all weapons, go to the briefing room, wait for your trainer.\n\n"
+                f"**## Hosted by {interaction.user.display_name}**\n"
+                f"**## Started at {current_time}**"
+            )
+            
+            settings = self.bot.config.get(interaction.guild.id)
+            if not settings.trainee_role or not interaction.guild.get_role(settings.trainee_role):
+                return await interaction.response.send_message(
+                    "❌ Trainee role not found!",
+                    ephemeral=True
+                )
+            targets = ridealong_targets(settings)
+            if not targets:
+                return await interaction.response.send_message(
+                    "❌ No ride along channel configured! Set one with `/config channel`.",
+                    ephemeral=True
+                )
+
+            try:
+                self.announcer.claim(("ridealong", interaction.user.id))
+            except DuplicateAnnouncement as e:
+                return await interaction.response.send_message(
+                    f"⚠️ You already started a ride along {e.age:.0f}s ago!",
+                    ephemeral=True
+                )
+
+            await interaction.response.send_message("📣 Announcing ride along session...", ephemeral=True)
+            deliveries = await self.announcer.announce(
+                "ridealong", embed, targets,
+                guild_id=interaction.guild.id,
+                after=lambda message: message.add_reaction("✅"),  # Auto-add checkmark reaction
+            )
+            if not any(d.ok for d in deliveries):
+                self.announcer.release(("ridealong", interaction.user.id))
+            for delivery in deliveries:
+                if delivery.ok:
+                    self.tracker.open(
+                        delivery.message.id, delivery.message.channel.id,
+                        interaction.guild.id, interaction.user.id, capacity=slots
+                    )
+            await interaction.followup.send(delivery_report(deliveries), ephemeral=True)
+
+        except Exception as e:
+            message = f"❌ Failed to create ride along: {str(e)}"
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
+
+    @ridealong.command(name="roster", description="Show who signed up for your ride along")
+    @is_trainer()
+    async def ridealong_roster(self, interaction: discord.Interaction):
+        """List sign-ups for the caller's latest ride along"""
+        session = self.tracker.for_host(interaction.user.id)
+        if session is None:
+            return await interaction.response.send_message("❌ You don't have an active ride along!", ephemeral=True)
+
+        signups = self.tracker.roster(session)
+        slots = f"/{session.capacity}" if session.capacity else ""
+        embed = discord.Embed(
+            title=f"Ride Along Roster ({len(signups)}{slots})",
+            description="\n".join(f"{i}. <@{user_id}>" for i, user_id in enumerate(signups, 1)) or "No sign-ups yet.",
+            color=0x5865F2
+        )
+        embed.add_field(name="Status", value="Closed" if session.closed else "Open")
+        embed.add_field(name="Started", value=f"<t:{int(session.started)}:R>")
+        embed.add_field(name="Announcement", value=f"https://discord.com/channels/{session.guild_id}/{session.channel_id}/{session.message_id}", inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @ridealong.command(name="close", description="Stop taking sign-ups for your ride along")
+    @is_trainer()
+    async def ridealong_close(self, interaction: discord.Interaction):
+        """Close the caller's latest ride along"""
+        session = self.tracker.for_host(interaction.user.id)
+        if session is None:
+            return await interaction.response.send_message("❌ You don't have an active ride along!", ephemeral=True)
+        if session.closed:
+            return await interaction.response.send_message("⚠️ Your ride along is already closed!", ephemeral=True)
+
+        self.tracker.close(session)
+        await interaction.response.send_message(
+            f"🔒 Ride along closed with {len(session.signups)} sign-up(s).",
+            ephemeral=True
+        )
+        await self._announce_closed(session)
+
+    async def _announce_closed(self, session: Session):
+        try:
+            channel = self.bot.get_channel(session.channel_id)
+            if channel is not None:
+                await channel.send(
+                    f"🔒 <@{session.host_id}>'s ride along is closed, {len(session.signups)} signed up.",
+                    allowed_mentions=discord.AllowedMentions.none()
+                )
+        except Exception as e:
+            log.warning("Failed to announce ride along close: %s", e)
+
+    # ======================
+    # SIGN-UP TRACKING
+    # ======================
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        if payload.user_id != self.bot.user.id:
+            self.tracker.add(payload.message_id, payload.user_id, str(payload.emoji))
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        self.tracker.remove(payload.message_id, payload.user_id, str(payload.emoji))
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Announcements(bot))
@@ -0,0 +1,103 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from guild_config import LIST_SETTINGS, SETTINGS
+
+ROLE_SETTINGS = {
+    "staff_roles": "Staff roles",
+    "trainer_roles": "Trainer roles",
+    "trainee_role": "Trainee role",
+    "auto_role": "Auto-role on join",
+    "notification_role": "Server startup ping",
+}
+CHANNEL_SETTINGS = {
+    "mod_log_channel": "Moderation log",
+    "announcement_channel": "Server startup announcements",
+    "ridealong_channel": "Ride along announcements",
+}
+LABELS = {**ROLE_SETTINGS, **CHANNEL_SETTINGS}
+
+
+def _choices(settings: dict):
+    return [app_commands.Choice(name=label, value=key) for key, label in settings.items()]
+
+
+def _mention(key: str, value) -> str:
+    if not value:
+        return "Not set"
+    ids = sorted(value) if key in LIST_SETTINGS else [value]
+    fmt = "<#{}>" if key.endswith("_channel") else "<@&{}>"
+    return ", ".join(fmt.format(i) for i in ids)
+
+
+@app_commands.guild_only()
+@app_commands.default_permissions(manage_guild=True)
+class Config(commands.GroupCog, group_name="config", group_description="Server settings for this bot"):
+    """Per-guild settings, changed live"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        super().__init__()
+
+    async def _toggle_or_set(self, interaction: discord.Interaction, key: str, value: int) -> str:
+        """Set a single-ID setting, or add/remove an ID from a list setting"""
+        current = getattr(self.bot.config.get(interaction.guild.id), key)
+        if key in LIST_SETTINGS:
+            if value in current:
+                await self.bot.config.set(interaction.guild.id, key, current - {value})
+                return "Removed from"
+            await self.bot.config.set(interaction.guild.id, key, current | {value})
+            return "Added to"
+        await self.bot.config.set(interaction.guild.id, key, value)
+        return "Set as"
+
+    @app_commands.command(name="show", description="Show this server's bot settings")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def show(self, interaction: discord.Interaction):
+        settings = self.bot.config.get(interaction.guild.id)
+        overridden = self.bot.config.overridden(interaction.guild.id)
+        embed = discord.Embed(title=f"Settings for {interaction.guild.name}", color=0x5865F2)
+        for key in SETTINGS:
+            source = "" if key in overridden else " (default)"
+            embed.add_field(name=f"{LABELS[key]}{source}", value=_mention(key, getattr(settings, key)), inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="role", description="Set a role setting (list settings toggle the role)")
+    @app_commands.describe(setting="Which setting to change", role="The role to use")
+    @app_commands.choices(setting=_choices(ROLE_SETTINGS))
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def role(self, interaction: discord.Interaction, setting: app_commands.Choice[str], role: discord.Role):
+        try:
+            verb = await self._toggle_or_set(interaction, setting.value, role.id)
+            await interaction.response.send_message(f"✅ {role.mention} {verb.lower()} **{setting.name}**", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to update setting: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="channel", description="Set a channel setting")
+    @app_commands.describe(setting="Which setting to change", channel="The channel to use")
+    @app_commands.choices(setting=_choices(CHANNEL_SETTINGS))
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def channel(self, interaction: discord.Interaction, setting: app_commands.Choice[str], channel: discord.TextChannel):
+        try:
+            if channel.guild.id != interaction.guild.id:
+                return await interaction.response.send_message("❌ That channel isn't in this server!", ephemeral=True)
+            verb = await self._toggle_or_set(interaction, setting.value, channel.id)
+            await interaction.response.send_message(f"✅ {channel.mention} {verb.lower()} **{setting.name}**", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to update setting: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="reset", description="Return a setting to the bot's default")
+    @app_commands.describe(setting="Which setting to reset")
+    @app_commands.choices(setting=_choices(LABELS))
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def reset(self, interaction: discord.Interaction, setting: app_commands.Choice[str]):
+        try:
+            await self.bot.config.reset(interaction.guild.id, setting.value)
+            await interaction.response.send_message(f"✅ **{setting.name}** reset to default", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to reset setting: {str(e)}", ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Config(bot))
@@ -0,0 +1,145 @@
+import asyncio
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from bot_commands import is_allowed, ERLC_LOG_CHANNELS, ERLC_SERVER_KEY
+from erlc_cache import ERLCReadCache
+from erlc_client import ERLCClient, ERLCResponse
+from erlc_dispatcher import CommandDispatcher
+from erlc_relay import LogRelay
+
+MAX_LISTED = 40
+
+
+def freshness(age: float) -> str:
+    return "Live" if age < 1 else f"Updated {age:.0f}s ago"
+
+
+def api_error(response: ERLCResponse) -> str:
+    if response.rate_limited:
+        return f"⏳ ER:LC is rate limiting requests. Try again in {response.retry_after:.0f}s."
+    return f"❌ API Error {response.status}: {response.text[:200]}"
+
+
+class ERLC(commands.GroupCog, group_name="erlc", group_description="ER:LC private server"):
+    """ER:LC private server integration"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.client = ERLCClient(ERLC_SERVER_KEY)
+        self.dispatcher = CommandDispatcher(self.client)
+        self.reads = ERLCReadCache(self.client)
+        self.relay = LogRelay(self.client, bot.mod_log, ERLC_LOG_CHANNELS)
+        super().__init__()
+
+    async def cog_load(self):
+        await self.client.start()
+        self.dispatcher.start()
+        await self.relay.start()
+
+    async def cog_unload(self):
+        await self.relay.close()
+        await self.reads.close()
+        await self.dispatcher.close()
+        await self.client.close()
+
+    @app_commands.command(name="run", description="Execute ER:LC in-game command")
+    @app_commands.describe(command="The command to execute (include ':')")
+    @is_allowed()
+    async def run(self, interaction: discord.Interaction, command: str):
+        try:
+            if not command.startswith(':'):
+                command = f":{command}"
+
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            response = await asyncio.shield(self.dispatcher.submit(command))
+            if response.ok:
+                await interaction.followup.send(f"✅ Executed `{command}`", ephemeral=True)
+            elif response.rate_limited:
+                await interaction.followup.send(
+                    f"⏳ ER:LC is rate limiting commands, `{command}` was not run. Try again in {response.retry_after:.0f}s.",
+                    ephemeral=True
+                )
+            else:
+                await interaction.followup.send(
+                    f"❌ API Error {response.status}: {response.text[:200]}",
+                    ephemeral=True
+                )
+        except Exception as e:
+            if interaction.response.is_done():
+                await interaction.followup.send(f"⚠️ Error: {str(e)}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"⚠️ Error: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="status", description="Show the ER:LC server status")
+    @is_allowed()
+    async def status(self, interaction: discord.Interaction):
+        try:
+            response, age = await self.reads.status()
+            if not response.ok:
+                await interaction.response.send_message(api_error(response), ephemeral=True)
+                return
+
+            data = response.data or {}
+            embed = discord.Embed(title=data.get("Name", "ER:LC Server"), color=discord.Color.blue())
+            embed.add_field(name="Players", value=f"{data.get('CurrentPlayers', 0)}/{data.get('MaxPlayers', 0)}")
+            embed.add_field(name="Join Code", value=data.get("JoinKey") or "—")
+            embed.add_field(name="Team Balance", value="On" if data.get("TeamBalance") else "Off")
+            embed.set_footer(text=freshness(age))
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"⚠️ Error: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="players", description="List players in the ER:LC server")
+    @is_allowed()
+    async def players(self, interaction: discord.Interaction):
+        try:
+            response, age = await self.reads.players()
+            if not response.ok:
+                await interaction.response.send_message(api_error(response), ephemeral=True)
+                return
+
+            players = response.data or []
+            teams = {}
+            for player in players:
+                name = str(player.get("Player", "?")).split(":", 1)[0]
+                if player.get("Callsign"):
+                    name = f"{name} ({player['Callsign']})"
+                teams.setdefault(player.get("Team") or "Unknown", []).append(name)
+
+            embed = discord.Embed(title=f"Players ({len(players)})", color=discord.Color.blue())
+            listed = 0
+            for team, names in sorted(teams.items()):
+                shown = names[:max(MAX_LISTED - listed, 0)]
+                listed += len(shown)
+                more = f"\n… and {len(names) - len(shown)} more" if len(shown) < len(names) else ""
+                embed.add_field(name=f"{team} ({len(names)})", value=(", ".join(shown) or "—") + more, inline=False)
+            if not players:
+                embed.description = "Nobody is in the server."
+            embed.set_footer(text=freshness(age))
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"⚠️ Error: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="queue", description="Show the ER:LC join queue")
+    @is_allowed()
+    async def queue(self, interaction: discord.Interaction):
+        try:
+            response, age = await self.reads.queue()
+            if not response.ok:
+                await interaction.response.send_message(api_error(response), ephemeral=True)
+                return
+
+            queued = response.data or []
+            await interaction.response.send_message(
+                f"🕒 {len(queued)} player(s) in queue · {freshness(age)}",
+                ephemeral=True
+            )
+        except Exception as e:
+            await interaction.response.send_message(f"⚠️ Error: {str(e)}", ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ERLC(bot))
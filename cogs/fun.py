@@ -0,0 +1,40 @@
+import discord
+from discord.ext import commands
+import random
+
+
+class Fun(commands.Cog):
+    """Joke commands"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    # Not registered as slash commands yet, as before the split into cogs;
+    # add @app_commands.command (and describe) to expose them.
+    async def ship(self, interaction: discord.Interaction, user1: discord.Member, user2: discord.Member):
+        # Generate random compatibility (51-100% for positive, 0-49% for negative)
+        score = random.randint(0, 100)
+        
+        if score >= 50:
+            message = f"💖 **MATCH!** {user1.mention} and {user2.mention} are {score}% compatible! 💘"
+        else:
+            message = f"💔 **NO MATCH...** {user1.mention} and {user2.mention} are only {score}% compatible. 😢"
+        
+        await interaction.response.send_message(message)
+
+    async def rizzcalculator(self, interaction: discord.Interaction, user1: discord.Member):
+        score = random.randint(0, 100)
+        if score <= 75:
+            message= "YOU GOT MAJOR SKIBIDI RIZZ😍. ALL THEM GIRLS WANT YOU."
+        if score <= 50:
+            message= "You have mediocre rizz. Some girls want you."
+        if score >= 50:
+            message= "No Rizz, No girls.:("
+        if score >= 25:
+            message= "ITS CRAZY HOW YOU HAVE NO RIZZ AT ALL..."
+
+        await interaction.response.send_message(message)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Fun(bot))
@@ -0,0 +1,316 @@
+import discord
+import logging
+from discord import app_commands, Embed
+from discord.ext import commands
+from datetime import datetime, timezone
+from typing import Optional
+
+import bulk_actions
+from bot_commands import is_allowed
+from infraction_store import ModAction
+from permissions import ENGINE
+
+log = logging.getLogger(__name__)
+
+
+class Moderation(commands.Cog):
+    """Kick, ban, infractions and moderation history"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def _record(self, interaction: discord.Interaction, action: ModAction, embed: Embed) -> bool:
+        """Store an action that already happened and log it; False if either step failed
+
+        Failures are logged rather than raised, so a kick or ban that went
+        through is never reported back as failed.
+        """
+        recorded = True
+        try:
+            await self.bot.infractions.add(action)
+        except Exception:
+            log.exception("Failed to store %s of %s", action.punishment, action.user_id)
+            recorded = False
+        try:
+            await self.bot.mod_log.send(
+                self.bot.config.get(interaction.guild.id).mod_log_channel, embed, guild_id=interaction.guild.id
+            )
+        except Exception:
+            log.exception("Failed to queue mod log for %s of %s", action.punishment, action.user_id)
+            recorded = False
+        return recorded
+
+    # ======================
+    # MODERATION COMMANDS
+    # ======================
+
+    @app_commands.command(name="kick", description="Kick a member from the server")
+    @app_commands.describe(
+        member="Member to kick",
+        reason="Reason for kick"
+    )
+    @app_commands.checks.has_permissions(kick_members=True)
+    @is_allowed()
+    async def kick(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided"):
+        if not ENGINE.outranks(interaction.user, member):
+            return await interaction.response.send_message("❌ You can't kick members with equal/higher roles!", ephemeral=True)
+
+        try:
+            await member.kick(reason=reason)
+        except Exception as e:
+            return await interaction.response.send_message(f"❌ Failed to kick member: {str(e)}", ephemeral=True)
+
+        embed = Embed(
+            title="Member Kicked",
+            description=f"{member.mention} was kicked by {interaction.user.mention}",
+            color=0xFFA500
+        )
+        embed.add_field(name="Reason", value=reason)
+
+        recorded = await self._record(interaction, ModAction(
+            guild_id=interaction.guild.id,
+            user_id=member.id,
+            moderator_id=interaction.user.id,
+            punishment="Kick",
+            reason=reason
+        ), embed)
+
+        message = f"✅ {member.display_name} has been kicked."
+        if not recorded:
+            message += " It could not be saved to the mod log or history."
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @app_commands.command(name="ban", description="Ban a member from the server")
+    @app_commands.describe(
+        member="Member to ban",
+        reason="Reason for ban",
+        delete_days="Days of messages to delete (0-7)"
+    )
+    @app_commands.checks.has_permissions(ban_members=True)
+    @is_allowed()
+    async def ban(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided", delete_days: int = 0):
+        if not ENGINE.outranks(interaction.user, member):
+            return await interaction.response.send_message("❌ You can't ban members with equal/higher roles!", ephemeral=True)
+
+        try:
+            await member.ban(reason=reason, delete_message_days=delete_days)
+        except Exception as e:
+            return await interaction.response.send_message(f"❌ Failed to ban member: {str(e)}", ephemeral=True)
+
+        embed = Embed(
+            title="Member Banned",
+            description=f"{member.mention} was banned by {interaction.user.mention}",
+            color=0xFF0000
+        )
+        embed.add_field(name="Reason", value=reason)
+        embed.add_field(name="Messages Deleted", value=f"{delete_days} days")
+
+        recorded = await self._record(interaction, ModAction(
+            guild_id=interaction.guild.id,
+            user_id=member.id,
+            moderator_id=interaction.user.id,
+            punishment="Ban",
+            reason=reason
+        ), embed)
+
+        message = f"✅ {member.display_name} has been banned."
+        if not recorded:
+            message += " It could not be saved to the mod log or history."
+        await interaction.response.send_message(message, ephemeral=True)
+
+    # ======================
+    # INFRACTION COMMAND
+    # ======================
+    @app_commands.command(name="infraction", description="Issue a staff infraction")
+    @app_commands.describe(
+        user="User receiving the infraction",
+        punishment="Type of punishment",
+        reason="Reason for infraction",
+        approved_by="Staff member approving this"
+    )
+    @app_commands.choices(punishment=[
+        app_commands.Choice(name="Demotion", value="Demotion"),
+        app_commands.Choice(name="Warning", value="Warning"),
+        app_commands.Choice(name="Strike", value="Strike"),
+        app_commands.Choice(name="Staff Blacklist + Demotion", value="Staff Blacklist + Demotion")
+    ])
+    @app_commands.checks.has_permissions(manage_roles=True)
+    @is_allowed()
+    async def infraction(
+        self,
+        interaction: discord.Interaction,
+        user: discord.Member,
+        punishment: app_commands.Choice[str],
+        reason: str,
+        approved_by: str
+    ):
+        """Create an infraction notice"""
+        try:
+            embed = discord.Embed(
+                title="New Horizons Border Roleplay",
+                color=0xFF0000  # Red color for infractions
+            )
+            embed.description = (
+                f"**Punishment:** {punishment.value}\n\n"
+                f"{user.mention}\n"
+                f"**Reason:** {reason}\n\n"
+                f"**How to appeal:** To appeal this infraction you can create a IA ticket.\n\n"
+                f"**Infraction Approved by:** {approved_by}"
+            )
+            
+            await self.bot.infractions.add(ModAction(
+                guild_id=interaction.guild.id,
+                user_id=user.id,
+                moderator_id=interaction.user.id,
+                punishment=punishment.value,
+                reason=reason,
+                approved_by=approved_by
+            ))
+
+            # Queue for the mod log writer
+            await self.bot.mod_log.send(
+                self.bot.config.get(interaction.guild.id).mod_log_channel, embed, guild_id=interaction.guild.id
+            )
+            
+            await interaction.response.send_message(
+                f"✅ Infraction issued for {user.mention}",
+                ephemeral=True
+            )
+        except Exception as e:
+            await interaction.response.send_message(
+                f"❌ Failed to issue infraction: {str(e)}",
+                ephemeral=True
+            )
+
+    @app_commands.command(name="history", description="Show a member's moderation history")
+    @app_commands.describe(user="Member to look up", limit="Number of entries to show (1-25)")
+    @is_allowed()
+    async def history(self, interaction: discord.Interaction, user: discord.Member, limit: app_commands.Range[int, 1, 25] = 10):
+        """Answer from the local infraction store"""
+        try:
+            actions = await self.bot.infractions.history(interaction.guild.id, user.id, limit)
+            counts = await self.bot.infractions.counts_for_user(interaction.guild.id, user.id)
+
+            embed = discord.Embed(title=f"Moderation history for {user.display_name}", color=0xFFA500)
+            if not actions:
+                embed.description = "No recorded kicks, bans or infractions."
+            else:
+                embed.description = ", ".join(f"**{name}:** {count}" for name, count in sorted(counts.items()))
+                for action in actions:
+                    when = datetime.fromtimestamp(action.created_at, tz=timezone.utc)
+                    value = f"{action.reason or 'No reason provided'}\nBy <@{action.moderator_id}>"
+                    if action.approved_by:
+                        value += f", approved by {action.approved_by}"
+                    embed.add_field(
+                        name=f"{action.punishment} • {discord.utils.format_dt(when, 'R')}",
+                        value=value[:1024],
+                        inline=False
+                    )
+
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to load history: {str(e)}", ephemeral=True)
+
+
+    # ======================
+    # BULK MODERATION
+    # ======================
+    async def _record_bulk(self, interaction: discord.Interaction, result: bulk_actions.BulkResult, punishment: str, reason: str):
+        if result.succeeded:
+            await self.bot.infractions.add_many(
+                ModAction(
+                    guild_id=interaction.guild.id,
+                    user_id=target.id,
+                    moderator_id=interaction.user.id,
+                    punishment=punishment,
+                    reason=reason
+                )
+                for target in result.succeeded
+            )
+
+    @app_commands.command(name="masskick", description="Kick many members at once")
+    @app_commands.describe(
+        targets="Member mentions or IDs, separated by spaces",
+        joined_within="Only members who joined in the last N minutes",
+        has_role="Only members with this role",
+        reason="Reason for kick"
+    )
+    @app_commands.checks.has_permissions(kick_members=True)
+    @is_allowed()
+    async def masskick(
+        self,
+        interaction: discord.Interaction,
+        targets: Optional[str] = None,
+        joined_within: Optional[app_commands.Range[int, 1, 10080]] = None,
+        has_role: Optional[discord.Role] = None,
+        reason: str = "No reason provided"
+    ):
+        try:
+            async def kick(target):
+                await interaction.guild.kick(target, reason=reason)
+
+            result = await bulk_actions.execute(
+                interaction,
+                verb="Kicking",
+                title="Mass Kick",
+                color=0xFFA500,
+                targets=targets,
+                joined_within=joined_within,
+                has_role=has_role,
+                reason=reason,
+                action=kick,
+                log_channel_id=self.bot.config.get(interaction.guild.id).mod_log_channel
+            )
+            await self._record_bulk(interaction, result, "Kick", reason)
+        except Exception as e:
+            if interaction.response.is_done():
+                await interaction.followup.send(f"❌ Failed to mass kick: {str(e)}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"❌ Failed to mass kick: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="massban", description="Ban many members (or IDs) at once")
+    @app_commands.describe(
+        targets="Member mentions or IDs, separated by spaces (IDs not in the server are banned too)",
+        joined_within="Only members who joined in the last N minutes",
+        has_role="Only members with this role",
+        reason="Reason for ban",
+        delete_days="Days of messages to delete (0-7)"
+    )
+    @app_commands.checks.has_permissions(ban_members=True)
+    @is_allowed()
+    async def massban(
+        self,
+        interaction: discord.Interaction,
+        targets: Optional[str] = None,
+        joined_within: Optional[app_commands.Range[int, 1, 10080]] = None,
+        has_role: Optional[discord.Role] = None,
+        reason: str = "No reason provided",
+        delete_days: app_commands.Range[int, 0, 7] = 0
+    ):
+        try:
+            async def ban(target):
+                await interaction.guild.ban(target, reason=reason, delete_message_days=delete_days)
+
+            result = await bulk_actions.execute(
+                interaction,
+                verb="Banning",
+                title="Mass Ban",
+                color=0xFF0000,
+                targets=targets,
+                joined_within=joined_within,
+                has_role=has_role,
+                reason=reason,
+                action=ban,
+                log_channel_id=self.bot.config.get(interaction.guild.id).mod_log_channel,
+                act_on_missing=True
+            )
+            await self._record_bulk(interaction, result, "Ban", reason)
+        except Exception as e:
+            if interaction.response.is_done():
+                await interaction.followup.send(f"❌ Failed to mass ban: {str(e)}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"❌ Failed to mass ban: {str(e)}", ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Moderation(bot))
@@ -0,0 +1,42 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from bot_commands import is_owner
+from instrumentation import command_stats
+
+
+def _ms(seconds) -> str:
+    return "–" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+class Owner(commands.Cog):
+    """Owner-only diagnostics"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="stats", description="Show per-command latency and REST statistics")
+    @is_owner()
+    async def stats(self, interaction: discord.Interaction):
+        rows = command_stats()
+        embed = discord.Embed(title="Command statistics", color=0x5865F2)
+        if not rows:
+            embed.description = "No commands handled since startup."
+        for row in rows[:25]:
+            embed.add_field(
+                name=f"/{row['command']} ({row['count']} runs)",
+                value=(
+                    f"First response p50/p99: {_ms(row['ttfr_p50'])}/{_ms(row['ttfr_p99'])} ms\n"
+                    f"Total p50/p99: {_ms(row['duration_p50'])}/{_ms(row['duration_p99'])} ms\n"
+                    f"REST calls: {row['rest_calls']:.0f} ({row['rest_failures']:.0f} failed), "
+                    f"errors: {row['errors']:.0f}, auto-deferred: {row['auto_defers']:.0f}"
+                ),
+                inline=False
+            )
+        embed.set_footer(text=f"Gateway latency {self.bot.latency * 1000:.0f} ms")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Owner(bot))
@@ -0,0 +1,194 @@
+import asyncio
+import discord
+import logging
+import time
+from discord import app_commands
+from discord.ext import commands
+from typing import Optional
+
+import bulk_actions
+from autorole import AutoRoleWorker
+from bot_commands import is_allowed
+from permissions import ENGINE
+
+log = logging.getLogger(__name__)
+
+
+class Roles(commands.Cog):
+    """Role and nickname management plus the join auto-role"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.autorole = AutoRoleWorker(
+            bot, lambda guild_id: bot.config.get(guild_id).auto_role, backlog_path=bot.autorole_backlog_path
+        )
+        # Join time to catch up from on the next ready; 0 checks every member,
+        # None means nothing was missed (fresh start already handled, or resumed)
+        self._catch_up_from: Optional[float] = 0
+
+    async def cog_load(self):
+        await self.autorole.start()
+        self.bot.config.subscribe(self._on_config_change)
+        if self.bot.is_ready():
+            self._catch_up_from = None
+            asyncio.create_task(self._reconcile())
+
+    async def cog_unload(self):
+        self.bot.config.unsubscribe(self._on_config_change)
+        await self.autorole.close()
+
+    def _on_config_change(self, guild_id: int, key: str, settings):
+        # A new auto-role applies to everyone already in the guild too
+        guild = self.bot.get_guild(guild_id)
+        if key == "auto_role" and guild is not None:
+            asyncio.create_task(self._reconcile_guild(guild))
+
+    async def _reconcile_guild(self, guild: discord.Guild, since: float = 0):
+        try:
+            queued = await self.autorole.reconcile(guild, since)
+            if queued:
+                log.info("Queued auto-role for %d members in %s", queued, guild.name)
+        except Exception:
+            log.exception("Failed to reconcile auto-roles in %s", guild.name)
+
+    async def _reconcile(self, since: float = 0):
+        for guild in self.bot.guilds:
+            await self._reconcile_guild(guild, since)
+
+    @commands.Cog.listener()
+    async def on_disconnect(self):
+        if self._catch_up_from is None:
+            # A minute of slack for clock skew between us and Discord
+            self._catch_up_from = time.time() - 60
+
+    @commands.Cog.listener()
+    async def on_resumed(self):
+        # Resuming replays missed events, member joins included
+        self._catch_up_from = None
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # on_ready only fires after a fresh session, whose missed joins are
+        # never replayed; catch up on members who joined while we were gone
+        since, self._catch_up_from = self._catch_up_from, None
+        if since is not None:
+            await self._reconcile(since)
+
+    # Auto-role on member join
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        role_id = self.bot.config.get(member.guild.id).auto_role
+        if role_id and member.guild.get_role(role_id):
+            self.autorole.enqueue(member)
+
+    @app_commands.command(name="addrole", description="Assign role to user")
+    @app_commands.describe(user="User to receive role", role="Role to assign")
+    @app_commands.checks.has_permissions(manage_roles=True)
+    @is_allowed()
+    async def addrole(self, interaction: discord.Interaction, user: discord.Member, role: discord.Role):
+        try:
+            if not interaction.guild.me.guild_permissions.manage_roles:
+                return await interaction.response.send_message("❌ I don't have permission to manage roles!", ephemeral=True)
+            if role.position >= ENGINE.top_position(interaction.guild.me):
+                return await interaction.response.send_message("❌ That role is higher than my highest role!", ephemeral=True)
+            await user.add_roles(role)
+            await interaction.response.send_message(f"✅ Added {role.mention} to {user.mention}", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to add role: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="removerole", description="Remove role from user")
+    @app_commands.describe(user="User to remove role from", role="Role to remove")
+    @app_commands.checks.has_permissions(manage_roles=True)
+    @is_allowed()
+    async def removerole(self, interaction: discord.Interaction, user: discord.Member, role: discord.Role):
+        try:
+            if role not in user.roles:
+                return await interaction.response.send_message(f"❌ {user.display_name} doesn't have {role.name} role!", ephemeral=True)
+            await user.remove_roles(role)
+            await interaction.response.send_message(f"✅ Removed {role.mention} from {user.mention}", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to remove role: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="nick", description="Change a user's nickname")
+    @app_commands.describe(user="User to rename", nickname="New nickname (leave empty to reset)")
+    @app_commands.checks.has_permissions(manage_nicknames=True)
+    @is_allowed()
+    async def nick(self, interaction: discord.Interaction, user: discord.Member, nickname: Optional[str] = None):
+        try:
+            if not interaction.guild.me.guild_permissions.manage_nicknames:
+                return await interaction.response.send_message("❌ I don't have nickname management permissions!", ephemeral=True)
+            if not ENGINE.outranks(interaction.guild.me, user):
+                return await interaction.response.send_message("❌ Cannot modify users with higher/equal roles!", ephemeral=True)
+            await user.edit(nick=nickname)
+            action = "reset" if nickname is None else f"changed to '{nickname}'"
+            await interaction.response.send_message(f"✅ Successfully {action} nickname for {user.mention}", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Failed to change nickname: {str(e)}", ephemeral=True)
+
+
+    @app_commands.command(name="massrole", description="Add or remove a role for many members at once")
+    @app_commands.describe(
+        role="Role to add or remove",
+        action="Whether to add or remove the role",
+        targets="Member mentions or IDs, separated by spaces",
+        joined_within="Only members who joined in the last N minutes",
+        has_role="Only members with this role"
+    )
+    @app_commands.choices(action=[
+        app_commands.Choice(name="Add", value="add"),
+        app_commands.Choice(name="Remove", value="remove")
+    ])
+    @app_commands.checks.has_permissions(manage_roles=True)
+    @is_allowed()
+    async def massrole(
+        self,
+        interaction: discord.Interaction,
+        role: discord.Role,
+        action: app_commands.Choice[str],
+        targets: Optional[str] = None,
+        joined_within: Optional[app_commands.Range[int, 1, 10080]] = None,
+        has_role: Optional[discord.Role] = None
+    ):
+        try:
+            if role.position >= ENGINE.top_position(interaction.guild.me):
+                return await interaction.response.send_message("❌ That role is higher than my highest role!", ephemeral=True)
+            if role.position >= ENGINE.top_position(interaction.user):
+                return await interaction.response.send_message("❌ You can't manage a role equal to/higher than your own!", ephemeral=True)
+
+            guild_id = interaction.guild.id
+            reason = f"/massrole by {interaction.user} ({interaction.user.id})"
+
+            async def apply(target):
+                # Raw route so a single request is made even for uncached members
+                if action.value == "add":
+                    await self.bot.http.add_role(guild_id, target.id, role.id, reason=reason)
+                else:
+                    await self.bot.http.remove_role(guild_id, target.id, role.id, reason=reason)
+
+            await bulk_actions.execute(
+                interaction,
+                verb="Adding role" if action.value == "add" else "Removing role",
+                title=f"Mass Role {action.name}: {role.name}",
+                color=0x5865F2,
+                targets=targets,
+                joined_within=joined_within,
+                has_role=has_role,
+                reason=reason,
+                action=apply,
+                log_channel_id=self.bot.config.get(interaction.guild.id).mod_log_channel,
+                check_hierarchy=False,
+                skip_if=lambda m: (
+                    ("already has the role" if m.get_role(role.id) else None)
+                    if action.value == "add"
+                    else (None if m.get_role(role.id) else "doesn't have the role")
+                )
+            )
+        except Exception as e:
+            if interaction.response.is_done():
+                await interaction.followup.send(f"❌ Failed to update roles: {str(e)}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"❌ Failed to update roles: {str(e)}", ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Roles(bot))
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+SYNC_STATE_PATH = os.getenv('COMMAND_SYNC_STATE', '.command_sync.json')
+
+
+def _scope_key(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake]) -> str:
+    # Keyed by application too, so switching tokens never skips a needed sync
+    scope = "global" if guild is None else f"guild:{guild.id}"
+    return f"{tree.client.application_id}:{scope}"
+
+
+def _command_payload(tree: app_commands.CommandTree, command) -> dict:
+    # discord.py 2.4 added the tree argument to to_dict()
+    try:
+        return command.to_dict(tree)
+    except TypeError:
+        return command.to_dict()
+
+
+def fingerprint(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """Hash of the payload that tree.sync() would upload for a scope"""
+    payloads = [_command_payload(tree, cmd) for cmd in tree.get_commands(guild=guild)]
+    payloads.sort(key=lambda p: (p.get("type", 1), p["name"]))
+    blob = json.dumps(payloads, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _load_state(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(path: str, state: dict):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def record_sync(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None, path: str = SYNC_STATE_PATH):
+    """Store the current fingerprint as synced (used after a forced sync)"""
+    state = _load_state(path)
+    state[_scope_key(tree, guild)] = fingerprint(tree, guild)
+    _save_state(path, state)
+
+
+async def sync_if_changed(
+    tree: app_commands.CommandTree,
+    guild: Optional[discord.abc.Snowflake] = None,
+    path: str = SYNC_STATE_PATH,
+) -> Optional[list]:
+    """Sync a scope only if its fingerprint differs from the last successful sync
+
+    Returns the synced commands, or None when the scope was already up to date.
+    """
+    key = _scope_key(tree, guild)
+    current = fingerprint(tree, guild)
+    state = _load_state(path)
+    if state.get(key) == current:
+        return None
+
+    synced = await tree.sync(guild=guild)
+    state[key] = current
+    _save_state(path, state)
+    return synced
@@ -1,44 +1,153 @@
+import logging
 import os
+import sys
+import time
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
-from keep_alive import keep_alive
+from autorole import BACKLOG_PATH
+from embed_writer import EmbedWriter
+from infraction_store import InfractionStore
+from health import HealthServer
+from instrumentation import InstrumentedTree
+from member_cache import MEMBER_CACHE_MODE, MEMBERS, client_options
+from command_sync import record_sync, sync_if_changed
+from bot_commands import DEFAULT_SETTINGS, HOME_GUILD_ID, HOME_SETTINGS, extension_name, load_extensions, watch_guild_config
+from guild_config import GuildConfigStore
+from logs import setup_logging
+from sqlite_store import Database
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 # Load environment variables
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 
+# Records are queued here and written by a background thread, off the event loop
+log_listener = setup_logging()
+log = logging.getLogger("dcbot")
+
 # Initialize bot with intents
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+# DCBOT_SHARDED=1 runs every shard this process needs in one AutoShardedBot
+BotBase = commands.AutoShardedBot if os.getenv('DCBOT_SHARDED', '').lower() in ('1', 'true', 'yes') else commands.Bot
+
+class DCBot(BotBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mod_log = EmbedWriter(self)
+        # One connection and database thread for every store
+        db = Database(os.getenv('DCBOT_DB_PATH', 'dcbot.db'))
+        self.infractions = InfractionStore(db)
+        self.config = GuildConfigStore(db, DEFAULT_SETTINGS, guild_defaults={HOME_GUILD_ID: HOME_SETTINGS})
+        self.health = HealthServer(self, port=int(os.getenv('PORT', '8080')))
+        self.autorole_backlog_path = BACKLOG_PATH
+
+    async def setup_hook(self):
+        self.tree.instrument_http(self.http)
+        MEMBERS.install(self)
+        await self.health.start()
+        await self.infractions.open()
+        # Before the extensions load, so cogs see each guild's settings
+        await self.config.open()
+        watch_guild_config(self.config)
+        try:
+            await register_and_sync()
+        except Exception as e:
+            log.exception("Error during startup: %s", e)
+
+    async def close(self):
+        # Cogs go first: their unload hooks still write to the mod log and
+        # config, and once they are gone nothing queues new work
+        for extension in tuple(self.extensions):
+            try:
+                await self.unload_extension(extension)
+            except Exception:
+                log.exception("Failed to unload %s", extension)
+        # Drain while the HTTP session is still open, then release the database
+        await self.mod_log.close()
+        await self.infractions.close()
+        await self.config.close()
+        await super().close()
+        await self.health.stop()
+
+bot = DCBot(
+    command_prefix='!',
+    intents=intents,
+    tree_cls=InstrumentedTree,
+    **client_options(MEMBER_CACHE_MODE, intents)
+)
+
+# Guild that gets an instant copy of every command while developing; TEST_GUILD_ID=0 turns it off
+TEST_GUILD_ID = int(os.getenv('TEST_GUILD_ID', '1320949220114432030'))
+TEST_GUILD = discord.Object(id=TEST_GUILD_ID) if TEST_GUILD_ID else None
+
+STARTED_AT = time.perf_counter()
+_first_ready = True
+
+def peak_rss_mb():
+    """Peak resident set size in MB, or None where getrusage isn't available"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux KiB
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
 
 @bot.event
 async def on_ready():
-    print(f'=== {bot.user} is online ===')
-    
-    # Clear existing commands
-    bot.tree.clear_commands(guild=None)
-    print("Cleared all existing commands")
-    
-    # Register commands
-    try:
-        from bot_commands import register_commands
-        register_commands(bot)
-        
-        # Sync commands
-        TEST_GUILD = discord.Object(id=1320949220114432030)  # Replace with your server ID
+    # on_ready fires again after every reconnect, so it only reports status
+    global _first_ready
+    log.info("=== %s is online ===", bot.user)
+    if _first_ready:
+        _first_ready = False
+        cached = sum(len(g.members) for g in bot.guilds)
+        rss_mb = peak_rss_mb()
+        elapsed = time.perf_counter() - STARTED_AT
+        log.info(
+            "Ready in %.1fs (member cache: %s, %d cached members, peak RSS %s)",
+            elapsed, MEMBER_CACHE_MODE, cached, "unknown" if rss_mb is None else f"{rss_mb:.0f} MB",
+            extra={
+                "ready_seconds": round(elapsed, 3),
+                "cached_members": cached,
+                "rss_mb": None if rss_mb is None else round(rss_mb),
+            },
+        )
+
+async def sync_commands():
+    """Sync only the scopes whose command fingerprint changed"""
+    # Guild copies are snapshots, so refresh them after any (re)load
+    if TEST_GUILD is not None:
+        bot.tree.clear_commands(guild=TEST_GUILD)
         bot.tree.copy_global_to(guild=TEST_GUILD)
-        await bot.tree.sync(guild=TEST_GUILD)
-        
-        synced = await bot.tree.sync()
-        print(f"Synced {len(synced)} commands:")
-        for cmd in synced:
-            print(f"- /{cmd.name}")
-    except Exception as e:
-        print(f"Error during startup: {e}")
+
+    for scope in ([TEST_GUILD] if TEST_GUILD is not None else []) + [None]:
+        label = "global" if scope is None else f"guild {scope.id}"
+        synced = await sync_if_changed(bot.tree, guild=scope)
+        if synced is None:
+            log.info("Commands unchanged for %s, skipped sync", label)
+        else:
+            log.info(
+                "Synced %d commands for %s: %s", len(synced), label, ", ".join(f"/{cmd.name}" for cmd in synced),
+                extra={"commands": [cmd.name for cmd in synced]},
+            )
+
+async def register_and_sync():
+    """Register commands once per process and sync only scopes that changed"""
+    start = time.perf_counter()
+    await load_extensions(bot)
+    registered = time.perf_counter()
+    await sync_commands()
+
+    log.info(
+        "Command setup took %.3fs (register %.3fs, sync %.3fs)",
+        time.perf_counter() - start, registered - start, time.perf_counter() - registered,
+    )
 
 @bot.command()
 @commands.is_owner()
@@ -46,18 +155,37 @@ async def nuclear_sync(ctx):
     """Force recreate all commands"""
     try:
         bot.tree.clear_commands(guild=None)
-        from bot_commands import register_commands
-        register_commands(bot)
+        await load_extensions(bot)
         synced = await bot.tree.sync()
+        record_sync(bot.tree)
         await ctx.send(f"🔥 Nuclear sync complete! ({len(synced)} commands)")
     except Exception as e:
         await ctx.send(f"❌ Error: {str(e)}")
 
+@bot.command()
+@commands.is_owner()
+async def reload(ctx, extension: str):
+    """Hot-reload one command extension without reconnecting"""
+    name = extension_name(extension)
+    try:
+        start = time.perf_counter()
+        await bot.reload_extension(name)
+        reloaded = time.perf_counter()
+        await sync_commands()
+        await ctx.send(
+            f"♻️ Reloaded `{name}` in {(reloaded - start) * 1000:.1f}ms "
+            f"(+{(time.perf_counter() - reloaded) * 1000:.1f}ms sync check)"
+        )
+    except Exception as e:
+        await ctx.send(f"❌ Error: {str(e)}")
+
 # Start the bot
-keep_alive()
 try:
-    bot.run(TOKEN)
+    # log_handler=None: discord.py logs through the queued root handler above
+    bot.run(TOKEN, log_handler=None)
 except discord.errors.LoginFailure:
-    print("Invalid token! Please check your DISCORD_TOKEN in .env")
+    log.error("Invalid token! Please check your DISCORD_TOKEN in .env")
 except Exception as e:
-    print(f"Bot crashed: {e}")
+    log.exception("Bot crashed: %s", e)
+finally:
+    log_listener.stop()
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+log = logging.getLogger(__name__)
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class EmbedWriter:
+    """Background writer that packs queued embeds into as few messages as possible
+
+    Each channel gets its own queue and worker. A worker sends once it has
+    ``max_batch`` embeds or ``flush_interval`` seconds after the first one
+    arrived, and never more often than ``min_send_interval`` per channel.
+    Embeds queued with a ``guild_id`` are only sent if the channel belongs
+    to that guild, since channel lookups are global across the bot.
+    """
+
+    def __init__(
+        self,
+        bot: discord.Client,
+        *,
+        max_batch: int = MAX_EMBEDS_PER_MESSAGE,
+        flush_interval: float = 2.0,
+        min_send_interval: float = 1.0,
+        max_queue: int = 1000,
+    ):
+        self.bot = bot
+        self.max_batch = min(max_batch, MAX_EMBEDS_PER_MESSAGE)
+        self.flush_interval = flush_interval
+        self.min_send_interval = min_send_interval
+        self.max_queue = max_queue
+        # Keyed by (channel ID, guild ID the channel must belong to)
+        self._queues: Dict[Tuple[int, Optional[int]], asyncio.Queue] = {}
+        self._workers: Dict[Tuple[int, Optional[int]], asyncio.Task] = {}
+        self._last_send: Dict[int, float] = {}
+        self._closing = asyncio.Event()
+
+    async def send(self, channel_id: Optional[int], embed: discord.Embed, *, guild_id: Optional[int] = None):
+        """Queue an embed for a channel; only waits when that channel's queue is full
+
+        A channel ID of None means logging is turned off and drops the embed.
+        With ``guild_id`` the embed is dropped unless the channel is in that guild.
+        """
+        if self._closing.is_set():
+            raise RuntimeError("Embed writer is shutting down")
+        if channel_id is None:
+            return
+        key = (channel_id, guild_id)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue(maxsize=self.max_queue)
+        worker = self._workers.get(key)
+        if worker is None or worker.done():
+            self._workers[key] = asyncio.create_task(
+                self._run(channel_id, guild_id, queue), name=f"embed-writer-{channel_id}"
+            )
+        await queue.put(embed)
+
+    def pending(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def close(self, timeout: float = 10):
+        """Flush everything still queued, then stop the workers"""
+        # Also wakes workers waiting out their flush interval
+        self._closing.set()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues.values())),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            log.warning("Mod log shutdown timed out with %d embeds unsent", self.pending())
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._workers.clear()
+
+    async def _collect(
+        self, queue: asyncio.Queue, carry: Optional[discord.Embed]
+    ) -> Tuple[List[discord.Embed], Optional[discord.Embed]]:
+        """Return the next batch plus an embed that did not fit into it"""
+        batch = [carry if carry is not None else await queue.get()]
+        chars = len(batch[0])
+        deadline = time.monotonic() + (0 if self._closing.is_set() else self.flush_interval)
+        while len(batch) < self.max_batch:
+            if queue.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closing.is_set():
+                    break
+                embed = await self._wait_for_embed(queue, remaining)
+                if embed is None:
+                    break
+            else:
+                embed = queue.get_nowait()
+            # Keep the combined message under Discord's per-message embed limit
+            if chars + len(embed) > MAX_EMBED_CHARS_PER_MESSAGE:
+                return batch, embed
+            batch.append(embed)
+            chars += len(embed)
+        return batch, None
+
+    async def _wait_for_embed(self, queue: asyncio.Queue, timeout: float) -> Optional[discord.Embed]:
+        """Next embed from the queue, or None on timeout or shutdown"""
+        getter = asyncio.ensure_future(queue.get())
+        closing = asyncio.ensure_future(self._closing.wait())
+        try:
+            await asyncio.wait((getter, closing), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            closing.cancel()
+            timed_out = not getter.done()
+            if timed_out:
+                # Queue.get leaves the item queued when cancelled
+                getter.cancel()
+        return None if timed_out else getter.result()
+
+    async def _resolve(self, channel_id: int, guild_id: Optional[int]) -> Optional[discord.abc.Messageable]:
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except discord.HTTPException:
+                return None
+        if guild_id is not None and getattr(getattr(channel, "guild", None), "id", None) != guild_id:
+            log.warning("Refusing to send guild %s logs to channel %s in another guild", guild_id, channel_id)
+            return None
+        return channel
+
+    async def _deliver(self, channel_id: int, guild_id: Optional[int], batch: List[discord.Embed]):
+        wait = self._last_send.get(channel_id, 0) + self.min_send_interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        channel = await self._resolve(channel_id, guild_id)
+        if channel is None:
+            log.warning("Dropped %d log embeds: channel %s not found", len(batch), channel_id)
+            return
+
+        for attempt in range(3):
+            try:
+                await channel.send(embeds=batch)
+                break
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt < 2:
+                    retry_after = getattr(e, "retry_after", None) or self.min_send_interval
+                    await asyncio.sleep(retry_after)
+                    continue
+                log.error("Failed to send %d log embeds to %s: %s", len(batch), channel_id, e)
+                break
+        self._last_send[channel_id] = time.monotonic()
+
+    async def _run(self, channel_id: int, guild_id: Optional[int], queue: asyncio.Queue):
+        carry = None
+        while True:
+            batch, carry = await self._collect(queue, carry)
+            try:
+                await self._deliver(channel_id, guild_id, batch)
+            finally:
+                # A carried embed is acknowledged with the batch that sends it
+                for _ in batch:
+                    queue.task_done()
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from erlc_client import ERLCClient, ERLCResponse
+from metrics import Counter
+
+log = logging.getLogger(__name__)
+
+CACHE_REQUESTS = Counter("dcbot_erlc_cache_requests_total", "ER:LC read cache lookups by result", ["resource", "result"])
+
+
+class CachedResource:
+    """One upstream resource behind a TTL cache with request coalescing
+
+    Within ``ttl`` the cached value is returned as is. Up to ``stale_ttl``
+    seconds after that the stale value is still returned immediately while a
+    single background refresh runs. Concurrent misses share one request.
+    """
+
+    def __init__(self, name: str, fetch: Callable[[], Awaitable[ERLCResponse]], ttl: float, stale_ttl: float):
+        self.name = name
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._value: Optional[ERLCResponse] = None
+        self._fetched_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+
+    def _refresh(self) -> asyncio.Task:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._load(), name=f"erlc-cache-{self.name}")
+            self._inflight.add_done_callback(self._report)
+        return self._inflight
+
+    def _report(self, task: asyncio.Task):
+        # Background refreshes have no waiter; retrieve the error so it isn't lost
+        if not task.cancelled() and task.exception() is not None:
+            log.warning("ER:LC %s refresh failed: %s", self.name, task.exception())
+
+    async def _load(self) -> ERLCResponse:
+        response = await self.fetch()
+        # Only successful reads replace what we have; errors keep serving stale data
+        if response.ok:
+            self._value = response
+            self._fetched_at = time.monotonic()
+        return response
+
+    async def get(self) -> Tuple[ERLCResponse, float]:
+        """Return (response, age in seconds)"""
+        age = time.monotonic() - self._fetched_at
+        if self._value is not None:
+            if age < self.ttl:
+                CACHE_REQUESTS.inc(resource=self.name, result="hit")
+                return self._value, age
+            if age < self.ttl + self.stale_ttl:
+                CACHE_REQUESTS.inc(resource=self.name, result="stale")
+                self._refresh()
+                return self._value, age
+
+        coalesced = self._inflight is not None and not self._inflight.done()
+        CACHE_REQUESTS.inc(resource=self.name, result="coalesced" if coalesced else "miss")
+        # Shield so one cancelled waiter doesn't cancel the shared request
+        response = await asyncio.shield(self._refresh())
+        if not response.ok and self._value is not None:
+            return self._value, time.monotonic() - self._fetched_at
+        return response, 0.0
+
+    def invalidate(self):
+        self._fetched_at = 0.0
+
+    async def close(self):
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+            try:
+                await self._inflight
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+class ERLCReadCache:
+    """Shared, coalesced reads of ER:LC server status, players and queue"""
+
+    def __init__(self, client: ERLCClient, *, ttl: float = 15, stale_ttl: float = 120):
+        self.resources: Dict[str, CachedResource] = {
+            "status": CachedResource("status", client.server_status, ttl, stale_ttl),
+            "players": CachedResource("players", client.players, ttl, stale_ttl),
+            "queue": CachedResource("queue", client.queue, ttl, stale_ttl),
+        }
+
+    async def status(self) -> Tuple[ERLCResponse, float]:
+        return await self.resources["status"].get()
+
+    async def players(self) -> Tuple[ERLCResponse, float]:
+        return await self.resources["players"].get()
+
+    async def queue(self) -> Tuple[ERLCResponse, float]:
+        return await self.resources["queue"].get()
+
+    def invalidate(self):
+        for resource in self.resources.values():
+            resource.invalidate()
+
+    async def close(self):
+        await asyncio.gather(*(r.close() for r in self.resources.values()))
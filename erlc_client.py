@@ -0,0 +1,149 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+import aiohttp
+
+ERLC_API_BASE = "https://api.policeroleplay.community/v1"
+
+
+@dataclass
+class ERLCResponse:
+    """Result of a single ER:LC API request"""
+    status: int
+    data: Any = None
+    text: str = ""
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def rate_limited(self) -> bool:
+        return self.status == 429
+
+    @property
+    def rate_limit_remaining(self) -> Optional[int]:
+        value = self.headers.get("X-RateLimit-Remaining")
+        return int(value) if value is not None else None
+
+    @property
+    def rate_limit_reset(self) -> Optional[float]:
+        """Epoch time at which the current rate-limit bucket refills"""
+        value = self.headers.get("X-RateLimit-Reset")
+        return float(value) if value is not None else None
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds to wait before retrying, from the body or the reset header"""
+        if isinstance(self.data, dict) and self.data.get("retry_after") is not None:
+            return max(float(self.data["retry_after"]), 0.0)
+        if self.rate_limit_reset is not None:
+            return max(self.rate_limit_reset - time.time(), 0.0)
+        return 1.0
+
+
+class ERLCClient:
+    """Long-lived ER:LC API client sharing one pooled aiohttp session"""
+
+    def __init__(
+        self,
+        server_key: Optional[str],
+        base_url: str = ERLC_API_BASE,
+        *,
+        max_connections: int = 10,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 60,
+        timeout: float = 5,
+    ):
+        self.server_key = server_key
+        self.base_url = base_url.rstrip("/")
+        self._max_connections = max_connections
+        self._dns_ttl = dns_ttl
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        """Create the pooled session (must be called inside the running loop)"""
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._max_connections,
+                    ttl_dns_cache=self._dns_ttl,
+                    use_dns_cache=True,
+                    keepalive_timeout=self._keepalive_timeout,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=self._timeout,
+                    headers={"Server-Key": self.server_key or ""},
+                )
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def request(self, method: str, path: str, *, json: Any = None) -> ERLCResponse:
+        """Send a request on the shared session and return the decoded response"""
+        if self._session is None or self._session.closed:
+            await self.start()
+
+        async with self._session.request(method, f"{self.base_url}{path}", json=json) as response:
+            text = await response.text()
+            data = None
+            if response.content_type == "application/json" and text:
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    data = None
+            return ERLCResponse(
+                status=response.status,
+                data=data,
+                text=text,
+                headers=response.headers.copy(),
+            )
+
+    # ======================
+    # COMMAND ENDPOINTS
+    # ======================
+
+    async def run_command(self, command: str) -> ERLCResponse:
+        """Execute an in-game command (a leading ':' is added if missing)"""
+        if not command.startswith(':'):
+            command = f":{command}"
+        return await self.request("POST", "/server/command", json={"command": command})
+
+    # ======================
+    # READ ENDPOINTS
+    # ======================
+
+    async def server_status(self) -> ERLCResponse:
+        return await self.request("GET", "/server")
+
+    async def players(self) -> ERLCResponse:
+        return await self.request("GET", "/server/players")
+
+    async def queue(self) -> ERLCResponse:
+        return await self.request("GET", "/server/queue")
+
+    async def join_logs(self) -> ERLCResponse:
+        return await self.request("GET", "/server/joinlogs")
+
+    async def kill_logs(self) -> ERLCResponse:
+        return await self.request("GET", "/server/killlogs")
+
+    async def command_logs(self) -> ERLCResponse:
+        return await self.request("GET", "/server/commandlogs")
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+from erlc_client import ERLCClient, ERLCResponse
+
+
+class CommandDispatcher:
+    """Queues ER:LC commands for one server key and paces them by the API rate limit
+
+    Identical commands that are still waiting in the queue share a single
+    request, and 429 responses are retried once the advertised reset passes.
+    """
+
+    def __init__(self, client: ERLCClient, *, max_retries: int = 3, max_queue: int = 500):
+        self.client = client
+        self.max_retries = max_retries
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._resume_at = 0.0
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="erlc-dispatcher")
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    @property
+    def backlog(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, command: str) -> asyncio.Future:
+        """Queue a command and return a future resolving to its ERLCResponse
+
+        The future is shared by every caller that submits the same command
+        while it waits, so await it through ``asyncio.shield`` to keep one
+        caller's cancellation from cancelling the others.
+        """
+        if not command.startswith(':'):
+            command = f":{command}"
+
+        future = self._pending.get(command)
+        if future is not None and not future.done():
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(command)
+        self._pending[command] = future
+        self.start()
+        return future
+
+    async def _wait_for_bucket(self):
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _update_bucket(self, response: ERLCResponse):
+        if response.rate_limited:
+            self._resume_at = time.time() + response.retry_after
+        elif response.rate_limit_remaining == 0 and response.rate_limit_reset is not None:
+            self._resume_at = response.rate_limit_reset
+
+    async def _send(self, command: str) -> ERLCResponse:
+        attempt = 0
+        while True:
+            await self._wait_for_bucket()
+            response = await self.client.run_command(command)
+            self._update_bucket(response)
+            if not response.rate_limited or attempt >= self.max_retries:
+                return response
+            attempt += 1
+
+    async def _run(self):
+        while True:
+            command = await self._queue.get()
+            # Stop coalescing once the request is in flight so a repeat runs again
+            future = self._pending.pop(command, None)
+            try:
+                if future is None or future.done():
+                    continue
+                try:
+                    response = await self._send(command)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    # The caller may have given up while the request was in flight
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(response)
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,242 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Set
+
+import discord
+
+from erlc_client import ERLCClient, ERLCResponse
+from metrics import Counter, Gauge
+
+log = logging.getLogger(__name__)
+
+RELAYED = Counter("dcbot_erlc_relay_entries_total", "ER:LC log entries forwarded to Discord", ["log"])
+POLLS = Counter("dcbot_erlc_relay_polls_total", "ER:LC log polls by result", ["log", "result"])
+LAG = Gauge("dcbot_erlc_relay_lag_seconds", "Age of the newest relayed ER:LC log entry", ["log"])
+
+# Lines per embed description; a full batch of 10 embeds stays well under 6000 chars
+LINES_PER_EMBED = 15
+MAX_DESCRIPTION = 4000
+
+
+def player_name(value) -> str:
+    """ER:LC reports players as "Name:UserId" """
+    return str(value or "?").split(":", 1)[0]
+
+
+def format_join(entry: dict) -> str:
+    verb = "joined" if entry.get("Join", True) else "left"
+    return f"<t:{int(entry['Timestamp'])}:T> **{player_name(entry.get('Player'))}** {verb}"
+
+
+def format_kill(entry: dict) -> str:
+    return (
+        f"<t:{int(entry['Timestamp'])}:T> **{player_name(entry.get('Killer'))}** killed "
+        f"**{player_name(entry.get('Killed'))}**"
+    )
+
+
+def format_command(entry: dict) -> str:
+    command = str(entry.get("Command", "")).replace("`", "'")[:300]
+    return f"<t:{int(entry['Timestamp'])}:T> **{player_name(entry.get('Player'))}** `{command}`"
+
+
+class LogStream:
+    """One ER:LC log endpoint and how its entries look in Discord"""
+
+    def __init__(self, name: str, title: str, color: discord.Color,
+                 fetch: Callable[[], Awaitable[ERLCResponse]], format: Callable[[dict], str]):
+        self.name = name
+        self.title = title
+        self.color = color
+        self.fetch = fetch
+        self.format = format
+
+
+def default_streams(client: ERLCClient) -> List[LogStream]:
+    return [
+        LogStream("join", "Join Logs", discord.Color.green(), client.join_logs, format_join),
+        LogStream("kill", "Kill Logs", discord.Color.red(), client.kill_logs, format_kill),
+        LogStream("command", "Command Logs", discord.Color.blue(), client.command_logs, format_command),
+    ]
+
+
+def fingerprint(entry: dict) -> str:
+    return hashlib.blake2b(json.dumps(entry, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+class Cursor:
+    """Newest timestamp relayed plus the entries seen at exactly that second
+
+    ER:LC timestamps have one-second resolution, so several entries can share
+    the newest timestamp; remembering their fingerprints keeps the next poll
+    from relaying them twice.
+    """
+
+    def __init__(self, timestamp: float = 0, seen: Optional[Set[str]] = None):
+        self.timestamp = timestamp
+        self.seen = seen or set()
+
+    def is_new(self, entry: dict) -> bool:
+        ts = entry["Timestamp"]
+        return ts > self.timestamp or (ts == self.timestamp and fingerprint(entry) not in self.seen)
+
+    def advance(self, entries: List[dict]):
+        for entry in entries:
+            ts = entry["Timestamp"]
+            if ts > self.timestamp:
+                self.timestamp = ts
+                self.seen = set()
+            if ts == self.timestamp:
+                self.seen.add(fingerprint(entry))
+
+    def to_json(self) -> dict:
+        return {"timestamp": self.timestamp, "seen": sorted(self.seen)}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Cursor":
+        return cls(float(data["timestamp"]), set(data.get("seen", ())))
+
+
+class LogRelay:
+    """Polls ER:LC logs and mirrors new entries into Discord channels
+
+    Cursors are persisted to ``cursor_path`` so a restart resumes where it
+    left off. A stream with no cursor yet starts from the newest entry rather
+    than replaying the server's history. Embeds go through ``writer`` (the
+    bot's EmbedWriter), whose bounded queues slow the poller down when
+    Discord is rate limiting.
+    """
+
+    def __init__(
+        self,
+        client: ERLCClient,
+        writer,
+        channels: Mapping[str, int],
+        *,
+        streams: Optional[List[LogStream]] = None,
+        cursor_path: str = ".erlc_relay.json",
+        interval: float = 15,
+        max_backoff: float = 300,
+    ):
+        self.writer = writer
+        self.channels = {name: channel_id for name, channel_id in channels.items() if channel_id}
+        self.streams = [s for s in (streams or default_streams(client)) if s.name in self.channels]
+        self.cursor_path = cursor_path
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.cursors: Dict[str, Cursor] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._save_lock = asyncio.Lock()
+
+    # ======================
+    # LIFECYCLE
+    # ======================
+
+    async def start(self):
+        if not self.streams:
+            return
+        self.cursors = await asyncio.to_thread(self._load)
+        self._tasks = [
+            asyncio.create_task(self._poll_loop(stream), name=f"erlc-relay-{stream.name}")
+            for stream in self.streams
+        ]
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.cursors:
+            await self._save()
+
+    def _load(self) -> Dict[str, Cursor]:
+        try:
+            with open(self.cursor_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {name: Cursor.from_json(cursor) for name, cursor in data.items()}
+
+    def _write(self, data: dict):
+        tmp = f"{self.cursor_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.cursor_path)
+
+    async def _save(self):
+        async with self._save_lock:
+            data = {name: cursor.to_json() for name, cursor in self.cursors.items()}
+            await asyncio.to_thread(self._write, data)
+
+    # ======================
+    # POLLING
+    # ======================
+
+    async def _poll_loop(self, stream: LogStream):
+        failures = 0
+        while True:
+            delay = self.interval
+            try:
+                response = await stream.fetch()
+                if response.ok:
+                    failures = 0
+                    POLLS.inc(log=stream.name, result="ok")
+                    await self.ingest(stream, response.data or [])
+                else:
+                    failures += 1
+                    POLLS.inc(log=stream.name, result="rate_limited" if response.rate_limited else "error")
+                    delay = response.retry_after if response.rate_limited else self._backoff(failures)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Outages keep the cursor where it is; nothing is skipped or replayed
+                failures += 1
+                POLLS.inc(log=stream.name, result="error")
+                delay = self._backoff(failures)
+                log.warning("ER:LC %s log poll failed (%dx): %s", stream.name, failures, e)
+            await asyncio.sleep(max(delay, self.interval))
+
+    def _backoff(self, failures: int) -> float:
+        return min(self.interval * 2 ** failures, self.max_backoff)
+
+    async def ingest(self, stream: LogStream, entries: List[dict]) -> int:
+        """Relay the entries newer than the stream's cursor; returns how many"""
+        entries = sorted((e for e in entries if isinstance(e, dict) and "Timestamp" in e),
+                         key=lambda e: e["Timestamp"])
+        cursor = self.cursors.get(stream.name)
+        if cursor is None:
+            # First run: start from now instead of replaying the whole log
+            cursor = self.cursors[stream.name] = Cursor()
+            cursor.advance(entries)
+            await self._save()
+            return 0
+
+        new = [e for e in entries if cursor.is_new(e)]
+        if not new:
+            return 0
+        for embed in self._embeds(stream, new):
+            await self.writer.send(self.channels[stream.name], embed)
+        cursor.advance(new)
+        await self._save()
+        RELAYED.inc(len(new), log=stream.name)
+        LAG.set(max(time.time() - cursor.timestamp, 0), log=stream.name)
+        return len(new)
+
+    def _embeds(self, stream: LogStream, entries: List[dict]) -> List[discord.Embed]:
+        embeds = []
+        lines: List[str] = []
+        size = 0
+        for entry in entries:
+            line = stream.format(entry)
+            if lines and (len(lines) >= LINES_PER_EMBED or size + len(line) + 1 > MAX_DESCRIPTION):
+                embeds.append(discord.Embed(title=stream.title, description="\n".join(lines), color=stream.color))
+                lines, size = [], 0
+            lines.append(line)
+            size += len(line) + 1
+        if lines:
+            embeds.append(discord.Embed(title=stream.title, description="\n".join(lines), color=stream.color))
+        return embeds
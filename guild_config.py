@@ -0,0 +1,164 @@
+import dataclasses
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+from sqlite_store import Database, SQLiteStore
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (guild_id, key)
+);
+"""
+
+
+@dataclass(frozen=True)
+class GuildSettings:
+    """Role and channel IDs one guild runs with"""
+    staff_roles: FrozenSet[int] = frozenset()
+    trainer_roles: FrozenSet[int] = frozenset()
+    trainee_role: Optional[int] = None
+    auto_role: Optional[int] = None
+    notification_role: Optional[int] = None
+    mod_log_channel: Optional[int] = None
+    announcement_channel: Optional[int] = None
+    ridealong_channel: Optional[int] = None
+
+
+# Settings holding several IDs; everything else holds one ID or None
+LIST_SETTINGS = {"staff_roles", "trainer_roles"}
+SETTINGS = [f.name for f in dataclasses.fields(GuildSettings)]
+
+# (guild_id, setting name, new settings)
+Listener = Callable[[int, str, GuildSettings], None]
+
+
+def _decode(key: str, raw: str) -> Any:
+    value = json.loads(raw)
+    return frozenset(value) if key in LIST_SETTINGS else value
+
+
+def _encode(key: str, value: Any) -> str:
+    return json.dumps(sorted(value) if key in LIST_SETTINGS else value)
+
+
+class GuildConfigStore(SQLiteStore):
+    """Per-guild settings in SQLite behind an in-memory cache
+
+    Every override is loaded by ``open`` and written through on change, so
+    ``get`` on the command path is a dict lookup. Overrides apply on top of
+    the guild's entry in ``guild_defaults``, or ``defaults`` for every other
+    guild. Listeners registered with ``subscribe`` are told about every
+    change so dependent caches can rebuild.
+    """
+
+    SCHEMA = SCHEMA
+
+    def __init__(
+        self,
+        db: Union[str, Database] = "dcbot.db",
+        defaults: GuildSettings = GuildSettings(),
+        *,
+        guild_defaults: Optional[Mapping[int, GuildSettings]] = None,
+    ):
+        super().__init__(db)
+        self.defaults = defaults
+        self.guild_defaults = dict(guild_defaults or {})
+        self._overrides: Dict[int, Dict[str, Any]] = {}
+        self._cache: Dict[int, GuildSettings] = {}
+        self._listeners: List[Listener] = []
+
+    def _load(self) -> List[Tuple[int, str, str]]:
+        return self._conn.execute("SELECT guild_id, key, value FROM guild_settings").fetchall()
+
+    async def open(self):
+        await super().open()
+        for guild_id, key, raw in await self._run(self._load):
+            if key not in SETTINGS:
+                log.warning("Ignoring unknown setting %s for guild %s", key, guild_id)
+                continue
+            self._overrides.setdefault(guild_id, {})[key] = _decode(key, raw)
+        self._cache = dict(self.guild_defaults)
+        for guild_id, overrides in self._overrides.items():
+            self._cache[guild_id] = dataclasses.replace(self._base(guild_id), **overrides)
+
+    def _base(self, guild_id: int) -> GuildSettings:
+        return self.guild_defaults.get(guild_id, self.defaults)
+
+    # ======================
+    # READS
+    # ======================
+
+    def get(self, guild_id: Optional[int]) -> GuildSettings:
+        return self._cache.get(guild_id, self.defaults)
+
+    def guilds(self) -> List[int]:
+        """Guilds with settings of their own, from overrides or ``guild_defaults``"""
+        return list(self._cache)
+
+    def overridden(self, guild_id: int) -> FrozenSet[str]:
+        return frozenset(self._overrides.get(guild_id, ()))
+
+    # ======================
+    # WRITES
+    # ======================
+
+    def _write(self, guild_id: int, key: str, raw: Optional[str]):
+        with self._conn:
+            if raw is None:
+                self._conn.execute("DELETE FROM guild_settings WHERE guild_id = ? AND key = ?", (guild_id, key))
+            else:
+                self._conn.execute(
+                    "INSERT INTO guild_settings (guild_id, key, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT (guild_id, key) DO UPDATE SET value = excluded.value",
+                    (guild_id, key, raw),
+                )
+
+    async def set(self, guild_id: int, key: str, value: Any) -> GuildSettings:
+        if key not in SETTINGS:
+            raise KeyError(key)
+        if key in LIST_SETTINGS:
+            value = frozenset(value)
+        await self._run(self._write, guild_id, key, _encode(key, value))
+        self._overrides.setdefault(guild_id, {})[key] = value
+        return self._changed(guild_id, key)
+
+    async def reset(self, guild_id: int, key: str) -> GuildSettings:
+        """Drop a guild's override so the default applies again"""
+        if key not in SETTINGS:
+            raise KeyError(key)
+        await self._run(self._write, guild_id, key, None)
+        overrides = self._overrides.get(guild_id, {})
+        overrides.pop(key, None)
+        if not overrides:
+            self._overrides.pop(guild_id, None)
+        return self._changed(guild_id, key)
+
+    def _changed(self, guild_id: int, key: str) -> GuildSettings:
+        overrides = self._overrides.get(guild_id)
+        if overrides:
+            settings = self._cache[guild_id] = dataclasses.replace(self._base(guild_id), **overrides)
+        elif guild_id in self.guild_defaults:
+            settings = self._cache[guild_id] = self.guild_defaults[guild_id]
+        else:
+            self._cache.pop(guild_id, None)
+            settings = self.defaults
+        for listener in self._listeners:
+            try:
+                listener(guild_id, key, settings)
+            except Exception:
+                log.exception("Guild config listener failed for %s", key)
+        return settings
+
+    def subscribe(self, listener: Listener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Optional
+
+import discord
+from aiohttp import web
+
+from metrics import REGISTRY, Gauge
+
+log = logging.getLogger(__name__)
+
+GATEWAY_LATENCY = Gauge("dcbot_gateway_latency_seconds", "Discord websocket heartbeat latency")
+LOOP_LAG = Gauge("dcbot_event_loop_lag_seconds", "How late the event loop woke the lag probe")
+GATEWAY_READY = Gauge("dcbot_gateway_ready", "1 while the gateway session is ready")
+GUILDS = Gauge("dcbot_guilds", "Guilds the bot is in")
+UPTIME = Gauge("dcbot_uptime_seconds", "Seconds since the health server started")
+
+
+class HealthServer:
+    """/healthz and /metrics served from the bot's own event loop"""
+
+    def __init__(
+        self,
+        bot: discord.Client,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        *,
+        probe_interval: float = 0.5,
+        max_loop_lag: float = 1.0,
+        max_latency: float = 5.0,
+    ):
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self.probe_interval = probe_interval
+        self.max_loop_lag = max_loop_lag
+        self.max_latency = max_latency
+        self.loop_lag = 0.0
+        self._started = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+        self._probe: Optional[asyncio.Task] = None
+
+        GATEWAY_LATENCY.set_function(lambda: self.bot.latency)
+        GATEWAY_READY.set_function(lambda: 1.0 if self.connected else 0.0)
+        GUILDS.set_function(lambda: len(self.bot.guilds))
+        LOOP_LAG.set_function(lambda: self.loop_lag)
+        UPTIME.set_function(lambda: time.monotonic() - self._started)
+
+    @property
+    def connected(self) -> bool:
+        return self.bot.is_ready() and not self.bot.is_closed() and self.bot.ws is not None
+
+    async def _measure_lag(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.probe_interval)
+            self.loop_lag = max(time.perf_counter() - start - self.probe_interval, 0.0)
+
+    def status(self) -> dict:
+        latency = self.bot.latency
+        if not math.isfinite(latency):
+            latency = None
+        healthy = (
+            self.connected
+            and latency is not None
+            and latency < self.max_latency
+            and self.loop_lag < self.max_loop_lag
+        )
+        return {
+            "status": "ok" if healthy else "degraded",
+            "gateway_connected": self.connected,
+            "websocket_latency_seconds": latency,
+            "event_loop_lag_seconds": round(self.loop_lag, 6),
+            "guilds": len(self.bot.guilds),
+            "uptime_seconds": round(time.monotonic() - self._started, 1),
+        }
+
+    async def _home(self, request: web.Request) -> web.Response:
+        # Kept for the uptime pinger that used the old keep_alive page
+        return web.Response(text="Bot is alive!")
+
+    async def _healthz(self, request: web.Request) -> web.Response:
+        status = self.status()
+        return web.json_response(status, status=200 if status["status"] == "ok" else 503)
+
+    async def _metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=REGISTRY.render(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/", self._home)
+        app.router.add_get("/healthz", self._healthz)
+        app.router.add_get("/metrics", self._metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self._probe = asyncio.create_task(self._measure_lag(), name="loop-lag-probe")
+        log.info("Health server listening on %s:%s", self.host, self.port)
+
+    async def stop(self):
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,111 @@
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from sqlite_store import SQLiteStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS moderation_actions (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    punishment TEXT NOT NULL,
+    reason TEXT NOT NULL DEFAULT '',
+    approved_by TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_actions_user
+    ON moderation_actions (guild_id, user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_actions_punishment
+    ON moderation_actions (guild_id, punishment, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_actions_created
+    ON moderation_actions (created_at);
+"""
+
+COLUMNS = "id, guild_id, user_id, moderator_id, punishment, reason, approved_by, created_at"
+
+
+@dataclass
+class ModAction:
+    """One kick, ban or infraction"""
+    guild_id: int
+    user_id: int
+    moderator_id: int
+    punishment: str
+    reason: str = ""
+    approved_by: Optional[str] = None
+    created_at: float = 0.0
+    id: Optional[int] = None
+
+
+class InfractionStore(SQLiteStore):
+    """SQLite (WAL) store for moderation actions"""
+
+    SCHEMA = SCHEMA
+
+    # ======================
+    # WRITES
+    # ======================
+
+    def _insert_many(self, actions: List[ModAction]) -> int:
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO moderation_actions "
+                "(guild_id, user_id, moderator_id, punishment, reason, approved_by, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (a.guild_id, a.user_id, a.moderator_id, a.punishment,
+                     a.reason, a.approved_by, a.created_at or now)
+                    for a in actions
+                ],
+            )
+        return len(actions)
+
+    async def add(self, action: ModAction):
+        await self._run(self._insert_many, [action])
+
+    async def add_many(self, actions: Iterable[ModAction]) -> int:
+        return await self._run(self._insert_many, list(actions))
+
+    # ======================
+    # READS
+    # ======================
+
+    def _select(self, sql: str, params: tuple) -> List[ModAction]:
+        rows = self._conn.execute(sql, params).fetchall()
+        return [
+            ModAction(id=r[0], guild_id=r[1], user_id=r[2], moderator_id=r[3], punishment=r[4],
+                      reason=r[5], approved_by=r[6], created_at=r[7])
+            for r in rows
+        ]
+
+    async def history(self, guild_id: int, user_id: int, limit: int = 10) -> List[ModAction]:
+        """Most recent actions against a user, newest first"""
+        return await self._run(
+            self._select,
+            f"SELECT {COLUMNS} FROM moderation_actions "
+            "WHERE guild_id = ? AND user_id = ? ORDER BY created_at DESC LIMIT ?",
+            (guild_id, user_id, limit),
+        )
+
+    async def by_punishment(self, guild_id: int, punishment: str, since: float = 0, limit: int = 50) -> List[ModAction]:
+        return await self._run(
+            self._select,
+            f"SELECT {COLUMNS} FROM moderation_actions "
+            "WHERE guild_id = ? AND punishment = ? AND created_at >= ? ORDER BY created_at DESC LIMIT ?",
+            (guild_id, punishment, since, limit),
+        )
+
+    def _count_for_user(self, guild_id: int, user_id: int) -> dict:
+        rows = self._conn.execute(
+            "SELECT punishment, COUNT(*) FROM moderation_actions "
+            "WHERE guild_id = ? AND user_id = ? GROUP BY punishment",
+            (guild_id, user_id),
+        ).fetchall()
+        return dict(rows)
+
+    async def counts_for_user(self, guild_id: int, user_id: int) -> dict:
+        """Number of actions per punishment type for a user"""
+        return await self._run(self._count_for_user, guild_id, user_id)
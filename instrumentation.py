@@ -0,0 +1,240 @@
+import asyncio
+import contextvars
+import functools
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import discord
+from discord import app_commands
+
+from metrics import Counter, Histogram
+
+DEFAULT_DEFER_BUDGET = float(os.getenv('AUTO_DEFER_BUDGET', '2.0'))
+
+FIRST_RESPONSE = Histogram(
+    "dcbot_command_first_response_seconds",
+    "Time from interaction receipt to the first interaction response",
+    ["command"],
+)
+DURATION = Histogram(
+    "dcbot_command_duration_seconds",
+    "Total time spent handling an application command",
+    ["command"],
+)
+INVOCATIONS = Counter("dcbot_command_invocations_total", "Application command invocations", ["command", "outcome"])
+REST_CALLS = Counter("dcbot_command_rest_calls_total", "Discord REST calls made while handling a command", ["command"])
+REST_FAILURES = Counter("dcbot_command_rest_failures_total", "Discord REST calls that failed while handling a command", ["command"])
+AUTO_DEFERS = Counter("dcbot_command_auto_defers_total", "Interactions deferred because the handler ran over budget", ["command"])
+
+
+@dataclass
+class Invocation:
+    command: str
+    started: float
+    interaction_id: Optional[int] = None
+    user_id: Optional[int] = None
+    guild_id: Optional[int] = None
+    first_response: Optional[float] = None
+    finished: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    watchdog: Optional[asyncio.Task] = None
+
+
+_current: contextvars.ContextVar[Optional[Invocation]] = contextvars.ContextVar("dcbot_invocation", default=None)
+_active: Dict[int, Invocation] = {}
+
+
+def current_command() -> Optional[str]:
+    """Qualified name of the command being handled in this task, if any"""
+    invocation = _current.get()
+    return invocation.command if invocation is not None and not invocation.finished else None
+
+
+def command_context() -> Dict[str, object]:
+    """Fields identifying the command being handled in this task, for log records"""
+    invocation = _current.get()
+    if invocation is None or invocation.finished:
+        return {}
+    return {
+        "command": invocation.command,
+        "interaction_id": invocation.interaction_id,
+        "user_id": invocation.user_id,
+        "guild_id": invocation.guild_id,
+    }
+
+
+# ======================
+# INTERACTION RESPONSE HOOKS
+# ======================
+
+_ORIGINAL_DEFER = discord.InteractionResponse.defer
+
+
+def _wrap_response(name: str):
+    original = getattr(discord.InteractionResponse, name)
+
+    @functools.wraps(original)
+    async def wrapper(self, *args, **kwargs):
+        interaction = self._parent
+        invocation = _active.get(interaction.id)
+        if invocation is None:
+            return await original(self, *args, **kwargs)
+
+        async with invocation.lock:
+            if self.is_done():
+                # The watchdog already deferred; turn the handler's reply into a followup
+                if name == "defer":
+                    return None
+                if name == "send_message":
+                    kwargs.pop("delete_after", None)
+                    return await interaction.followup.send(*args, **kwargs)
+            if invocation.first_response is None:
+                invocation.first_response = time.perf_counter()
+            # Counted as a REST call by the webhook adapter hook below
+            return await original(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _patch_interaction_response():
+    if getattr(discord.InteractionResponse, "_dcbot_instrumented", False):
+        return
+    for name in ("send_message", "defer", "send_modal"):
+        setattr(discord.InteractionResponse, name, _wrap_response(name))
+    discord.InteractionResponse._dcbot_instrumented = True
+
+
+async def _count_rest_call(original, *args, **kwargs):
+    invocation = _current.get()
+    if invocation is None or invocation.finished:
+        return await original(*args, **kwargs)
+    REST_CALLS.inc(command=invocation.command)
+    try:
+        return await original(*args, **kwargs)
+    except discord.HTTPException:
+        REST_FAILURES.inc(command=invocation.command)
+        raise
+
+
+def _patch_webhook_adapter():
+    # Interaction responses, followup.send and edit_original_response all go
+    # through the webhook adapter rather than the bot's HTTPClient
+    adapter = discord.webhook.async_.AsyncWebhookAdapter
+    if getattr(adapter, "_dcbot_instrumented", False):
+        return
+    original = adapter.request
+
+    @functools.wraps(original)
+    async def request(self, *args, **kwargs):
+        return await _count_rest_call(original, self, *args, **kwargs)
+
+    adapter.request = request
+    adapter._dcbot_instrumented = True
+
+
+class InstrumentedTree(app_commands.CommandTree):
+    """Command tree that times every command and defers slow ones automatically
+
+    A command can override the budget with ``extras={"defer_budget": seconds}``
+    (``None`` disables auto-defer) and ``extras={"defer_ephemeral": False}``.
+    """
+
+    def __init__(self, client, *args, defer_budget: float = DEFAULT_DEFER_BUDGET, **kwargs):
+        super().__init__(client, *args, **kwargs)
+        self.defer_budget = defer_budget
+        _patch_interaction_response()
+        _patch_webhook_adapter()
+        client.add_listener(self._on_completion, "on_app_command_completion")
+
+    def instrument_http(self, http):
+        """Count REST calls made by command handlers (call once the client exists)
+
+        Interaction responses and followups are counted separately through
+        the webhook adapter, so together this covers every call.
+        """
+        original = http.request
+
+        async def request(route, **kwargs):
+            return await _count_rest_call(original, route, **kwargs)
+
+        http.request = request
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.type is discord.InteractionType.application_command:
+            self._begin(interaction)
+        return True
+
+    def _begin(self, interaction: discord.Interaction):
+        command = interaction.command
+        name = command.qualified_name if command is not None else interaction.data.get("name", "unknown")
+        invocation = Invocation(
+            command=name,
+            started=time.perf_counter(),
+            interaction_id=interaction.id,
+            user_id=interaction.user.id,
+            guild_id=interaction.guild_id,
+        )
+        _active[interaction.id] = invocation
+        _current.set(invocation)
+
+        extras = getattr(command, "extras", {}) or {}
+        budget = extras.get("defer_budget", self.defer_budget)
+        if budget is not None:
+            ephemeral = extras.get("defer_ephemeral", True)
+            invocation.watchdog = asyncio.create_task(self._watch(interaction, invocation, budget, ephemeral))
+
+    async def _watch(self, interaction: discord.Interaction, invocation: Invocation, budget: float, ephemeral: bool):
+        await asyncio.sleep(budget)
+        async with invocation.lock:
+            if invocation.finished or interaction.response.is_done():
+                return
+            try:
+                await _ORIGINAL_DEFER(interaction.response, ephemeral=ephemeral, thinking=True)
+                invocation.first_response = time.perf_counter()
+                AUTO_DEFERS.inc(command=invocation.command)
+            except discord.HTTPException:
+                # Already counted as a failed REST call by the webhook adapter
+                pass
+
+    def _finish(self, interaction: discord.Interaction, outcome: str):
+        invocation = _active.pop(interaction.id, None)
+        if invocation is None:
+            return
+        invocation.finished = True
+        if invocation.watchdog is not None:
+            invocation.watchdog.cancel()
+        end = time.perf_counter()
+        DURATION.observe(end - invocation.started, command=invocation.command)
+        FIRST_RESPONSE.observe((invocation.first_response or end) - invocation.started, command=invocation.command)
+        INVOCATIONS.inc(command=invocation.command, outcome=outcome)
+
+    async def _on_completion(self, interaction: discord.Interaction, command):
+        self._finish(interaction, "ok")
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        outcome = "denied" if isinstance(error, app_commands.CheckFailure) else "error"
+        self._finish(interaction, outcome)
+        await super().on_error(interaction, error)
+
+
+def command_stats() -> list:
+    """Per-command summary rows used by /stats"""
+    rows = []
+    for labels in DURATION.label_sets():
+        name = labels["command"]
+        rows.append({
+            "command": name,
+            "count": DURATION.count(command=name),
+            "ttfr_p50": FIRST_RESPONSE.quantile(0.5, command=name),
+            "ttfr_p99": FIRST_RESPONSE.quantile(0.99, command=name),
+            "duration_p50": DURATION.quantile(0.5, command=name),
+            "duration_p99": DURATION.quantile(0.99, command=name),
+            "rest_calls": REST_CALLS.get(command=name),
+            "rest_failures": REST_FAILURES.get(command=name),
+            "errors": INVOCATIONS.get(command=name, outcome="error"),
+            "auto_defers": AUTO_DEFERS.get(command=name),
+        })
+    rows.sort(key=lambda r: r["count"], reverse=True)
+    return rows
@@ -0,0 +1,139 @@
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from typing import Dict, Optional, TextIO, Tuple
+
+from instrumentation import command_context
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()  # json | text
+
+# Attributes every LogRecord has; anything else came from extra= or a filter
+_RESERVED = set(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+
+
+class ContextFilter(logging.Filter):
+    """Stamps records with the slash command being handled in the emitting task
+
+    Runs in the caller before the record is queued, since the listener
+    thread can't see the caller's context variables.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in command_context().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets at most ``burst`` identical warnings/errors through per ``interval``
+
+    Records are identical when they share a logger, level and unformatted
+    message, so "Failed to assign auto-role to %s" counts as one error no
+    matter the member. The first record after a quiet window carries the
+    number that were dropped as ``suppressed``.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 60, level: int = logging.WARNING):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.level = level
+        # key -> (window start, records seen in window)
+        self._windows: Dict[Tuple[str, int, str], Tuple[float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        start, seen = self._windows.get(key, (now, 0))
+        if now - start >= self.interval:
+            if seen > self.burst:
+                record.suppressed = seen - self.burst
+            start, seen = now, 0
+        self._windows[key] = (start, seen + 1)
+        if len(self._windows) > 1000:
+            # Forget windows that have gone quiet so the dict stays small
+            self._windows = {k: v for k, v in self._windows.items() if now - v[0] < self.interval}
+        return seen < self.burst
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, then any context fields"""
+
+    converter = time.gmtime
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Classic one-line records with any context fields appended in brackets"""
+
+    converter = time.gmtime
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = " ".join(f"{k}={v}" for k, v in record.__dict__.items() if k not in _RESERVED)
+        return f"{line} [{fields}]" if fields else line
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only merge the message here; tracebacks and JSON are rendered by the
+        # listener thread, off the event loop
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    fmt: str = LOG_FORMAT,
+    stream: Optional[TextIO] = None,
+) -> logging.handlers.QueueListener:
+    """Route all logging through a queue drained by a background thread
+
+    Returns the started listener; call ``stop()`` on it at exit to flush.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = _QueueHandler(log_queue)
+    handler.addFilter(ContextFilter())
+    handler.addFilter(RateLimitFilter())
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JSONFormatter() if fmt == "json" else TextFormatter())
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,105 @@
+import os
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import discord
+
+# full: chunk every guild at startup and cache all members (discord.py default)
+# lazy: no startup chunking; cache members as they join or show up in events
+# lru:  no member cache at all; keep only recently active members in an LRU
+MEMBER_CACHE_MODES = ("full", "lazy", "lru")
+MEMBER_CACHE_MODE = os.getenv('MEMBER_CACHE_MODE', 'full').lower()
+MEMBER_LRU_SIZE = int(os.getenv('MEMBER_LRU_SIZE', '5000'))
+
+
+def client_options(mode: str = MEMBER_CACHE_MODE, intents: Optional[discord.Intents] = None) -> dict:
+    """Keyword arguments for commands.Bot implementing a caching mode"""
+    if mode not in MEMBER_CACHE_MODES:
+        raise ValueError(f"MEMBER_CACHE_MODE must be one of {', '.join(MEMBER_CACHE_MODES)}, not {mode!r}")
+    if mode == "full":
+        return {"chunk_guilds_at_startup": True}
+    if mode == "lazy":
+        flags = discord.MemberCacheFlags.from_intents(intents) if intents else discord.MemberCacheFlags()
+        return {"chunk_guilds_at_startup": False, "member_cache_flags": flags}
+    return {"chunk_guilds_at_startup": False, "member_cache_flags": discord.MemberCacheFlags.none()}
+
+
+class MemberLRU:
+    """Recently active members, bounded to ``capacity`` entries across all guilds"""
+
+    def __init__(self, capacity: int = MEMBER_LRU_SIZE):
+        self.capacity = capacity
+        self._members: "OrderedDict[Tuple[int, int], discord.Member]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def remember(self, member: discord.Member):
+        key = (member.guild.id, member.id)
+        self._members[key] = member
+        self._members.move_to_end(key)
+        if len(self._members) > self.capacity:
+            self._members.popitem(last=False)
+
+    def forget(self, guild_id: int, member_id: int):
+        self._members.pop((guild_id, member_id), None)
+
+    def get(self, guild: discord.Guild, member_id: int) -> Optional[discord.Member]:
+        """Cached lookup: the guild's own member cache first, then the LRU"""
+        member = guild.get_member(member_id)
+        if member is not None:
+            return member
+        key = (guild.id, member_id)
+        member = self._members.get(key)
+        if member is not None:
+            self._members.move_to_end(key)
+        return member
+
+    async def get_or_fetch(self, guild: discord.Guild, member_id: int) -> Optional[discord.Member]:
+        member = self.get(guild, member_id)
+        if member is not None:
+            self.hits += 1
+            return member
+        self.misses += 1
+        try:
+            member = await guild.fetch_member(member_id)
+        except discord.NotFound:
+            return None
+        self.remember(member)
+        return member
+
+    # ======================
+    # LISTENERS
+    # ======================
+
+    async def on_interaction(self, interaction: discord.Interaction):
+        if isinstance(interaction.user, discord.Member):
+            self.remember(interaction.user)
+
+    async def on_member_join(self, member: discord.Member):
+        self.remember(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if (after.guild.id, after.id) in self._members:
+            self.remember(after)
+
+    async def on_raw_member_remove(self, payload):
+        self.forget(payload.guild_id, payload.user.id)
+
+    def install(self, bot):
+        for name in ("on_interaction", "on_member_join", "on_member_update", "on_raw_member_remove"):
+            bot.add_listener(getattr(self, name), name)
+
+
+MEMBERS = MemberLRU()
+
+
+async def all_members(guild: discord.Guild) -> List[discord.Member]:
+    """Every member of a guild, chunking on demand when it isn't cached"""
+    if guild.chunked:
+        return list(guild.members)
+    # Gateway chunking returns 1000 members per event, far faster than REST paging;
+    # cache=False keeps the chunk out of memory in the lazy/lru modes
+    return await guild.chunk(cache=False)
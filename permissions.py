@@ -0,0 +1,80 @@
+import enum
+from typing import Dict, Iterable, Mapping, Optional
+
+import discord
+from discord import app_commands
+
+
+class Capability(enum.IntFlag):
+    NONE = 0
+    STAFF = enum.auto()
+    TRAINER = enum.auto()
+
+
+def compile_roles(grants: Mapping[Capability, Iterable[int]]) -> Dict[int, Capability]:
+    """Invert {capability: role IDs} into {role ID: capability bits}"""
+    capabilities: Dict[int, Capability] = {}
+    for capability, role_ids in grants.items():
+        for role_id in role_ids:
+            capabilities[role_id] = capabilities.get(role_id, Capability.NONE) | capability
+    return capabilities
+
+
+class PermissionEngine:
+    """Capability checks compiled from the role configuration
+
+    Role IDs map straight to capability bits, so a check is one dict lookup
+    and bitwise OR per role the member holds. Nothing is cached per member:
+    checks and hierarchy comparisons always use the roles on the Member
+    object in hand, so a demotion or promotion takes effect at once.
+    """
+
+    def __init__(self, role_capabilities: Optional[Mapping[int, Capability]] = None):
+        # guild ID -> role capabilities for guilds with their own configuration
+        self._guild_roles: Dict[int, Dict[int, int]] = {}
+        self.configure(role_capabilities or {})
+
+    def configure(self, role_capabilities: Mapping[int, Capability]):
+        """Role capabilities for every guild without its own configuration"""
+        # Plain ints: IntFlag arithmetic is several times slower on the check path
+        self.role_capabilities = {role_id: int(bits) for role_id, bits in role_capabilities.items()}
+
+    def configure_guild(self, guild_id: int, role_capabilities: Mapping[int, Capability]):
+        self._guild_roles[guild_id] = {role_id: int(bits) for role_id, bits in role_capabilities.items()}
+
+    def _bits(self, member: discord.Member) -> int:
+        bits = 0
+        lookup = self._guild_roles.get(member.guild.id, self.role_capabilities).get
+        for role in member.roles:
+            bits |= lookup(role.id, 0)
+        return bits
+
+    def capabilities(self, member: discord.Member) -> Capability:
+        return Capability(self._bits(member))
+
+    def has(self, member: discord.Member, required: Capability) -> bool:
+        required = int(required)
+        return self._bits(member) & required == required
+
+    def top_position(self, member: discord.Member) -> int:
+        """Position of the member's highest role, from their current roles"""
+        return max((role.position for role in member.roles), default=0)
+
+    def outranks(self, actor: discord.Member, target: discord.Member) -> bool:
+        """Strictly higher top role, the rule used by every hierarchy check"""
+        return self.top_position(actor) > self.top_position(target)
+
+
+ENGINE = PermissionEngine()
+
+
+def requires(capability: Capability, message: str = "❌ You don't have permission to use this bot!"):
+    """Declarative command check backed by the permission engine"""
+    async def predicate(interaction: discord.Interaction):
+        if interaction.guild is None:
+            raise app_commands.NoPrivateMessage()
+        if not ENGINE.has(interaction.user, capability):
+            await interaction.response.send_message(message, ephemeral=True)
+            return False
+        return True
+    return app_commands.check(predicate)
@@ -0,0 +1,130 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+SIGNUP_EMOJI = "✅"
+
+
+class Session:
+    """One ride along announcement and the members who reacted to it"""
+
+    __slots__ = ("message_id", "channel_id", "guild_id", "host_id", "started", "expires", "capacity", "closed", "signups")
+
+    def __init__(self, message_id: int, channel_id: int, guild_id: int, host_id: int,
+                 ttl: float, capacity: Optional[int]):
+        self.message_id = message_id
+        self.channel_id = channel_id
+        self.guild_id = guild_id
+        self.host_id = host_id
+        self.started = time.time()
+        self.expires = time.monotonic() + ttl
+        self.capacity = capacity
+        self.closed = False
+        # member ID -> sign-up time; dicts keep insertion order, so this is the queue
+        self.signups: Dict[int, float] = {}
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    @property
+    def full(self) -> bool:
+        return self.capacity is not None and len(self.signups) >= self.capacity
+
+
+class RideAlongTracker:
+    """Ride along sign-ups built from raw reaction events, answered from memory
+
+    Only reaction add/remove payloads are used, so no message cache or
+    reaction-user pagination is needed. Sessions expire after ``ttl``
+    seconds; at most ``max_sessions`` are kept (oldest dropped first) and
+    each records at most ``max_signups`` members, bounding memory.
+    ``on_close`` is called with a session when it fills up.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 3 * 3600,
+        max_sessions: int = 500,
+        max_signups: int = 200,
+        on_close: Optional[Callable[[Session], None]] = None,
+    ):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_signups = max_signups
+        self.on_close = on_close
+        self._sessions: "OrderedDict[int, Session]" = OrderedDict()
+        # host ID -> message ID of their newest session
+        self._by_host: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _drop(self, message_id: int):
+        session = self._sessions.pop(message_id, None)
+        if session is not None and self._by_host.get(session.host_id) == message_id:
+            del self._by_host[session.host_id]
+
+    def prune(self):
+        """Drop expired sessions; sessions expire in the order they were opened"""
+        while self._sessions:
+            message_id, session = next(iter(self._sessions.items()))
+            if not session.expired:
+                break
+            self._drop(message_id)
+
+    def open(self, message_id: int, channel_id: int, guild_id: int, host_id: int,
+             *, capacity: Optional[int] = None) -> Session:
+        self.prune()
+        session = Session(message_id, channel_id, guild_id, host_id, self.ttl, capacity)
+        self._sessions[message_id] = session
+        self._by_host[host_id] = message_id
+        while len(self._sessions) > self.max_sessions:
+            self._drop(next(iter(self._sessions)))
+        return session
+
+    def get(self, message_id: int) -> Optional[Session]:
+        session = self._sessions.get(message_id)
+        if session is not None and session.expired:
+            self._drop(message_id)
+            return None
+        return session
+
+    def for_host(self, host_id: int) -> Optional[Session]:
+        message_id = self._by_host.get(host_id)
+        return self.get(message_id) if message_id is not None else None
+
+    def close(self, session: Session):
+        session.closed = True
+
+    # ======================
+    # REACTION EVENTS
+    # ======================
+
+    def add(self, message_id: int, user_id: int, emoji: str) -> bool:
+        """Record a sign-up; returns whether the roster changed"""
+        if emoji != SIGNUP_EMOJI:
+            return False
+        session = self.get(message_id)
+        if session is None or session.closed or user_id == session.host_id or user_id in session.signups:
+            return False
+        if len(session.signups) >= self.max_signups:
+            return False
+        session.signups[user_id] = time.time()
+        if session.full:
+            self.close(session)
+            if self.on_close is not None:
+                self.on_close(session)
+        return True
+
+    def remove(self, message_id: int, user_id: int, emoji: str) -> bool:
+        if emoji != SIGNUP_EMOJI:
+            return False
+        session = self.get(message_id)
+        if session is None or session.closed:
+            return False
+        return session.signups.pop(user_id, None) is not None
+
+    def roster(self, session: Session) -> List[int]:
+        return list(session.signups)
@@ -0,0 +1,76 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+
+class Database:
+    """One SQLite (WAL) connection owned by a dedicated thread
+
+    All database work runs on that thread so the connection is never shared
+    between threads and the event loop never blocks on disk I/O. Several
+    stores can use the same Database; it closes when the last one does.
+    """
+
+    def __init__(self, path: str = "dcbot.db"):
+        self.path = path
+        self.conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._users = 0
+
+    async def run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _connect(self, schema: str):
+        if self.conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn = conn
+        self.conn.executescript(schema)
+
+    def _disconnect(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    async def acquire(self, schema: str = ""):
+        """Connect if nobody has yet and create ``schema``"""
+        await self.run(self._connect, schema)
+        self._users += 1
+
+    async def release(self):
+        self._users -= 1
+        if self._users <= 0:
+            await self.run(self._disconnect)
+            self._executor.shutdown(wait=True)
+
+
+class SQLiteStore:
+    """Base for stores kept in a Database, their own or one shared with other stores
+
+    Subclasses set ``SCHEMA`` and do their queries on ``_conn`` inside ``_run``.
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, db: Union[str, Database] = "dcbot.db"):
+        self.db = db if isinstance(db, Database) else Database(db)
+
+    @property
+    def path(self) -> str:
+        return self.db.path
+
+    @property
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        return self.db.conn
+
+    async def _run(self, fn, *args):
+        return await self.db.run(fn, *args)
+
+    async def open(self):
+        await self.db.acquire(self.SCHEMA)
+
+    async def close(self):
+        await self.db.release()
@@ -0,0 +1,56 @@
+"""Runs every bench_commands scenario, failing on errors, missing side effects or a blown p99 budget.
+
+The budget is generous for CI machines; tighten it locally with
+BENCH_MAX_P99_MS=20 python -m pytest tests/test_bench_commands.py
+"""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("aiohttp")
+
+from bench_commands import run_command, scenarios  # noqa: E402
+from bot_commands import ANNOUNCEMENT_CHANNEL_ID, MOD_LOG_CHANNEL  # noqa: E402
+from harness import OfflineBot  # noqa: E402
+from instrumentation import INVOCATIONS  # noqa: E402
+
+MAX_P99_MS = float(os.getenv("BENCH_MAX_P99_MS", "250"))
+CALLS = 20
+CONCURRENCY = 5
+
+
+def test_commands_succeed_within_p99_budget():
+    async def main():
+        results = []
+        async with OfflineBot() as h:
+            for name, make_args in scenarios(h).items():
+                if h.command(name) is None:
+                    continue
+                results.append(await run_command(h, name, make_args, CALLS, CONCURRENCY))
+            # Flush queued mod-log embeds before looking at the channel
+            await h.bot.mod_log.close()
+            logged = [e.title for m in h.guild.get_channel(MOD_LOG_CHANNEL).sent for e in m.embeds]
+            announced = len(h.guild.get_channel(ANNOUNCEMENT_CHANNEL_ID).sent)
+            recorded = {
+                punishment: len(await h.bot.infractions.by_punishment(h.guild.id, punishment))
+                for punishment in ("Kick", "Ban", "Warning")
+            }
+        return results, logged, announced, recorded
+
+    results, logged, announced, recorded = asyncio.run(main())
+    assert results
+
+    failed = {r["command"]: r["failures"] for r in results if r["failures"]}
+    assert not failed, f"commands replied with an error or not at all: {failed}"
+    # Every call went through the InstrumentedTree bookkeeping
+    untracked = [r["command"] for r in results if INVOCATIONS.get(command=r["command"], outcome="ok") < CALLS]
+    assert not untracked, untracked
+    slow = {r["command"]: round(r["p99"] * 1000, 1) for r in results if r["p99"] * 1000 > MAX_P99_MS}
+    assert not slow, f"p99 over {MAX_P99_MS} ms: {slow}"
+
+    for title in ("Member Kicked", "Member Banned", "New Horizons Border Roleplay", "Mass Kick", "Mass Ban"):
+        assert title in logged, f"no {title!r} embed in the mod log"
+    assert announced > 0
+    assert all(count > 0 for count in recorded.values()), recorded
@@ -0,0 +1,97 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+discord = pytest.importorskip("discord")
+
+from embed_writer import MAX_EMBED_CHARS_PER_MESSAGE, EmbedWriter  # noqa: E402
+
+HOME = 1
+OTHER = 2
+
+
+class Channel:
+    def __init__(self, channel_id, guild_id):
+        self.id = channel_id
+        self.guild = SimpleNamespace(id=guild_id)
+        self.sent = []
+
+    async def send(self, *, embeds):
+        self.sent.append(embeds)
+
+
+class Bot:
+    def __init__(self, *channels):
+        self.channels = {channel.id: channel for channel in channels}
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+
+def embed(n, size=10):
+    return discord.Embed(title=str(n), description="x" * size)
+
+
+def make_writer(*channels, flush_interval=0.05):
+    return EmbedWriter(Bot(*channels), flush_interval=flush_interval, min_send_interval=0)
+
+
+def test_batches_up_to_ten_embeds_per_message():
+    channel = Channel(10, HOME)
+
+    async def main():
+        writer = make_writer(channel)
+        for n in range(25):
+            await writer.send(channel.id, embed(n), guild_id=HOME)
+        await writer.close()
+
+    asyncio.run(main())
+    assert [len(message) for message in channel.sent] == [10, 10, 5]
+    assert [e.title for message in channel.sent for e in message] == [str(n) for n in range(25)]
+
+
+def test_batches_stay_under_the_character_limit():
+    channel = Channel(10, HOME)
+
+    async def main():
+        writer = make_writer(channel)
+        for n in range(5):
+            await writer.send(channel.id, embed(n, size=2500))
+        await writer.close()
+
+    asyncio.run(main())
+    assert [len(message) for message in channel.sent] == [2, 2, 1]
+    assert all(sum(len(e) for e in message) <= MAX_EMBED_CHARS_PER_MESSAGE for message in channel.sent)
+    assert [e.title for message in channel.sent for e in message] == [str(n) for n in range(5)]
+
+
+def test_refuses_channels_in_another_guild():
+    foreign = Channel(20, OTHER)
+
+    async def main():
+        writer = make_writer(foreign)
+        await writer.send(foreign.id, embed(0), guild_id=HOME)
+        await writer.close()
+        return writer
+
+    writer = asyncio.run(main())
+    assert foreign.sent == []
+    assert writer.pending() == 0
+
+
+def test_close_drains_without_waiting_out_the_flush_interval():
+    channel = Channel(10, HOME)
+
+    async def main():
+        writer = make_writer(channel, flush_interval=60)
+        for n in range(3):
+            await writer.send(channel.id, embed(n))
+        # Let the worker pick up the batch and start waiting for more
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(writer.close(timeout=5), 1)
+        with pytest.raises(RuntimeError):
+            await writer.send(channel.id, embed(3))
+
+    asyncio.run(main())
+    assert [[e.title for e in message] for message in channel.sent] == [["0", "1", "2"]]
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from erlc_client import ERLCResponse  # noqa: E402
+from erlc_dispatcher import CommandDispatcher  # noqa: E402
+
+
+class FakeClient:
+    """Answers run_command from a list of statuses, optionally holding each call"""
+
+    def __init__(self, statuses=(), hold: bool = False):
+        self.statuses = list(statuses)
+        self.calls = []
+        self.hold = hold
+        self.release = asyncio.Event()
+        self.started = asyncio.Event()
+
+    async def run_command(self, command):
+        self.calls.append(command)
+        self.started.set()
+        if self.hold:
+            await self.release.wait()
+        status = self.statuses.pop(0) if self.statuses else 200
+        if isinstance(status, Exception):
+            raise status
+        data = {"retry_after": 0} if status == 429 else None
+        return ERLCResponse(status, data=data)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_adds_colon_and_resolves():
+    async def main():
+        client = FakeClient()
+        dispatcher = CommandDispatcher(client)
+        response = await dispatcher.submit("h hello")
+        await dispatcher.close()
+        return client.calls, response
+
+    calls, response = run(main())
+    assert calls == [":h hello"]
+    assert response.ok
+
+
+def test_identical_queued_commands_share_one_request():
+    async def main():
+        client = FakeClient()
+        dispatcher = CommandDispatcher(client)
+        first, second = dispatcher.submit(":h a"), dispatcher.submit("h a")
+        other = dispatcher.submit(":h b")
+        await asyncio.gather(first, second, other)
+        await dispatcher.close()
+        return client.calls, first is second
+
+    calls, shared = run(main())
+    assert shared
+    assert calls == [":h a", ":h b"]
+
+
+def test_repeat_after_send_starts_runs_again():
+    async def main():
+        client = FakeClient(hold=True)
+        dispatcher = CommandDispatcher(client)
+        first = dispatcher.submit(":h a")
+        await client.started.wait()
+        second = dispatcher.submit(":h a")
+        client.release.set()
+        await asyncio.gather(first, second)
+        await dispatcher.close()
+        return client.calls, first is second
+
+    calls, shared = run(main())
+    assert not shared
+    assert calls == [":h a", ":h a"]
+
+
+def test_retries_rate_limited_commands():
+    async def main():
+        client = FakeClient([429, 429, 200])
+        dispatcher = CommandDispatcher(client, max_retries=3)
+        response = await dispatcher.submit(":h a")
+        await dispatcher.close()
+        return len(client.calls), response
+
+    calls, response = run(main())
+    assert calls == 3
+    assert response.ok
+
+
+def test_gives_up_after_max_retries():
+    async def main():
+        client = FakeClient([429, 429, 429])
+        dispatcher = CommandDispatcher(client, max_retries=1)
+        response = await dispatcher.submit(":h a")
+        await dispatcher.close()
+        return len(client.calls), response
+
+    calls, response = run(main())
+    assert calls == 2
+    assert response.rate_limited
+
+
+def test_errors_reach_the_caller_and_worker_keeps_going():
+    async def main():
+        client = FakeClient([RuntimeError("boom"), 200])
+        dispatcher = CommandDispatcher(client)
+        with pytest.raises(RuntimeError):
+            await dispatcher.submit(":h a")
+        response = await dispatcher.submit(":h b")
+        await dispatcher.close()
+        return response
+
+    assert run(main()).ok
+
+
+def test_cancelled_caller_does_not_kill_worker():
+    async def main():
+        client = FakeClient(hold=True)
+        dispatcher = CommandDispatcher(client)
+        future = dispatcher.submit(":h a")
+        await client.started.wait()
+        future.cancel()
+        client.release.set()
+        response = await asyncio.wait_for(dispatcher.submit(":h b"), 1)
+        await dispatcher.close()
+        return response
+
+    assert run(main()).ok
+
+
+def test_shielded_callers_survive_another_callers_cancellation():
+    async def main():
+        client = FakeClient(hold=True)
+        dispatcher = CommandDispatcher(client)
+
+        async def caller():
+            return await asyncio.shield(dispatcher.submit(":h a"))
+
+        waiters = [asyncio.create_task(caller()) for _ in range(2)]
+        await client.started.wait()
+        waiters[0].cancel()
+        client.release.set()
+        response = await waiters[1]
+        await dispatcher.close()
+        return waiters[0].cancelled(), response
+
+    cancelled, response = run(main())
+    assert cancelled
+    assert response.ok
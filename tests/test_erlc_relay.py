@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("discord")
+
+from erlc_relay import Cursor, LogRelay, LogStream, format_join  # noqa: E402
+
+
+def entry(ts, player="Player:1", join=True):
+    return {"Timestamp": ts, "Player": player, "Join": join}
+
+
+def test_cursor_is_new_by_timestamp():
+    cursor = Cursor()
+    cursor.advance([entry(10), entry(12)])
+    assert cursor.timestamp == 12
+    assert not cursor.is_new(entry(11))
+    assert cursor.is_new(entry(13))
+
+
+def test_cursor_dedupes_entries_sharing_the_newest_second():
+    cursor = Cursor()
+    cursor.advance([entry(10, "A:1")])
+    assert not cursor.is_new(entry(10, "A:1"))
+    assert cursor.is_new(entry(10, "B:2"))
+    cursor.advance([entry(10, "B:2")])
+    assert not cursor.is_new(entry(10, "B:2"))
+    cursor.advance([entry(11, "C:3")])
+    assert cursor.seen and len(cursor.seen) == 1
+
+
+def test_cursor_round_trips_through_json():
+    cursor = Cursor()
+    cursor.advance([entry(10, "A:1"), entry(10, "B:2")])
+    restored = Cursor.from_json(json.loads(json.dumps(cursor.to_json())))
+    assert restored.timestamp == cursor.timestamp
+    assert restored.seen == cursor.seen
+
+
+class Writer:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, channel_id, embed, **kwargs):
+        self.sent.append((channel_id, embed))
+
+
+def make_relay(tmp_path):
+    stream = LogStream("join", "Join Logs", None, None, format_join)
+    return LogRelay(None, Writer(), {"join": 55}, streams=[stream], cursor_path=str(tmp_path / "cursor.json")), stream
+
+
+def test_first_poll_starts_from_newest_entry(tmp_path):
+    relay, stream = make_relay(tmp_path)
+    assert asyncio.run(relay.ingest(stream, [entry(10), entry(11)])) == 0
+    assert relay.writer.sent == []
+    assert relay.cursors["join"].timestamp == 11
+
+
+def test_relays_only_new_entries_and_persists_cursor(tmp_path):
+    relay, stream = make_relay(tmp_path)
+
+    async def run():
+        await relay.ingest(stream, [entry(10, "A:1")])
+        relayed = await relay.ingest(stream, [entry(10, "A:1"), entry(10, "B:2"), entry(12, "C:3")])
+        again = await relay.ingest(stream, [entry(10, "B:2"), entry(12, "C:3")])
+        return relayed, again
+
+    assert asyncio.run(run()) == (2, 0)
+    assert [channel for channel, _ in relay.writer.sent] == [55]
+    assert "B" in relay.writer.sent[0][1].description and "C" in relay.writer.sent[0][1].description
+    assert relay._load()["join"].timestamp == 12
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from guild_config import GuildConfigStore, GuildSettings
+from infraction_store import InfractionStore, ModAction
+from sqlite_store import Database
+
+HOME = 1
+OTHER = 2
+DEFAULTS = GuildSettings(mod_log_channel=10)
+HOME_DEFAULTS = GuildSettings(mod_log_channel=20, staff_roles=frozenset({5}))
+
+
+@pytest.fixture
+def run_store(tmp_path):
+    path = str(tmp_path / "test.db")
+
+    def run(test):
+        async def main():
+            store = GuildConfigStore(path, DEFAULTS, guild_defaults={HOME: HOME_DEFAULTS})
+            await store.open()
+            try:
+                return await test(store)
+            finally:
+                await store.close()
+        return asyncio.run(main())
+    return run
+
+
+def test_guild_defaults_apply_before_overrides(run_store):
+    async def test(store):
+        assert store.get(HOME) == HOME_DEFAULTS
+        assert store.get(OTHER) == DEFAULTS
+        assert store.guilds() == [HOME]
+        settings = await store.set(HOME, "auto_role", 30)
+        assert settings == GuildSettings(mod_log_channel=20, staff_roles=frozenset({5}), auto_role=30)
+        assert store.overridden(HOME) == {"auto_role"}
+
+    run_store(test)
+
+
+def test_overrides_survive_reopening(run_store):
+    async def first(store):
+        await store.set(OTHER, "staff_roles", [7, 6])
+
+    async def second(store):
+        return store.get(OTHER)
+
+    run_store(first)
+    assert run_store(second) == GuildSettings(mod_log_channel=10, staff_roles=frozenset({6, 7}))
+
+
+def test_reset_falls_back_to_the_right_default(run_store):
+    async def test(store):
+        await store.set(HOME, "mod_log_channel", 21)
+        await store.set(OTHER, "mod_log_channel", 11)
+        assert await store.reset(HOME, "mod_log_channel") == HOME_DEFAULTS
+        assert await store.reset(OTHER, "mod_log_channel") == DEFAULTS
+        assert store.guilds() == [HOME]
+        assert store.overridden(OTHER) == frozenset()
+        with pytest.raises(KeyError):
+            await store.reset(HOME, "not_a_setting")
+
+    run_store(test)
+
+
+def test_listeners_hear_every_change(run_store):
+    async def test(store):
+        heard = []
+
+        def listener(guild_id, key, settings):
+            heard.append((guild_id, key, settings.auto_role))
+
+        def broken(guild_id, key, settings):
+            raise RuntimeError("listener bug")
+
+        store.subscribe(broken)
+        store.subscribe(listener)
+        await store.set(OTHER, "auto_role", 30)
+        await store.reset(OTHER, "auto_role")
+        store.unsubscribe(listener)
+        await store.set(OTHER, "auto_role", 31)
+        return heard
+
+    assert run_store(test) == [(OTHER, "auto_role", 30), (OTHER, "auto_role", None)]
+
+
+def test_stores_share_one_connection(tmp_path):
+    async def main():
+        db = Database(str(tmp_path / "test.db"))
+        infractions = InfractionStore(db)
+        config = GuildConfigStore(db)
+        await infractions.open()
+        await config.open()
+        assert infractions._conn is config._conn
+        await infractions.add(ModAction(guild_id=HOME, user_id=1, moderator_id=2, punishment="Kick"))
+        await infractions.close()
+        # Still open for the store that hasn't closed yet
+        await config.set(HOME, "auto_role", 30)
+        await config.close()
+        return db
+
+    assert asyncio.run(main()).conn is None
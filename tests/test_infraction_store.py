@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from infraction_store import InfractionStore, ModAction
+
+GUILD = 1
+USER = 100
+
+
+def action(punishment, created_at, user_id=USER, guild_id=GUILD):
+    return ModAction(guild_id=guild_id, user_id=user_id, moderator_id=5, punishment=punishment,
+                     reason=f"{punishment} at {created_at}", created_at=created_at)
+
+
+@pytest.fixture
+def run_store(tmp_path):
+    def run(test):
+        async def main():
+            store = InfractionStore(str(tmp_path / "test.db"))
+            await store.open()
+            try:
+                return await test(store)
+            finally:
+                await store.close()
+        return asyncio.run(main())
+    return run
+
+
+def test_add_many_inserts_every_action(run_store):
+    async def test(store):
+        added = await store.add_many(action("Warning", t) for t in range(1, 4))
+        return added, await store.history(GUILD, USER)
+
+    added, history = run_store(test)
+    assert added == 3
+    assert len(history) == 3
+    assert all(a.id is not None for a in history)
+
+
+def test_history_is_newest_first_and_limited_to_guild_and_user(run_store):
+    async def test(store):
+        await store.add_many([
+            action("Warning", 1),
+            action("Kick", 3),
+            action("Strike", 2),
+            action("Ban", 4, user_id=USER + 1),
+            action("Ban", 5, guild_id=GUILD + 1),
+        ])
+        return await store.history(GUILD, USER), await store.history(GUILD, USER, limit=2)
+
+    history, limited = run_store(test)
+    assert [a.punishment for a in history] == ["Kick", "Strike", "Warning"]
+    assert [a.punishment for a in limited] == ["Kick", "Strike"]
+    assert history[0] == ModAction(guild_id=GUILD, user_id=USER, moderator_id=5, punishment="Kick",
+                                   reason="Kick at 3", created_at=3, id=history[0].id)
+
+
+def test_add_stamps_actions_without_a_time(run_store):
+    async def test(store):
+        await store.add(ModAction(guild_id=GUILD, user_id=USER, moderator_id=5, punishment="Kick"))
+        return await store.history(GUILD, USER)
+
+    (stored,) = run_store(test)
+    assert stored.created_at > 0
+
+
+def test_counts_for_user_groups_by_punishment(run_store):
+    async def test(store):
+        await store.add_many([
+            action("Warning", 1),
+            action("Warning", 2),
+            action("Kick", 3),
+            action("Warning", 4, user_id=USER + 1),
+        ])
+        return await store.counts_for_user(GUILD, USER), await store.counts_for_user(GUILD, USER + 2)
+
+    counts, empty = run_store(test)
+    assert counts == {"Warning": 2, "Kick": 1}
+    assert empty == {}
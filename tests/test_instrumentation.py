@@ -0,0 +1,139 @@
+import asyncio
+import itertools
+import json
+from types import SimpleNamespace
+
+import pytest
+
+discord = pytest.importorskip("discord")
+web = pytest.importorskip("aiohttp.web")
+
+import aiohttp  # noqa: E402
+from discord.ext import commands  # noqa: E402
+
+from instrumentation import AUTO_DEFERS, DURATION, REST_CALLS, REST_FAILURES, InstrumentedTree  # noqa: E402
+
+BUDGET = 0.05
+_ids = itertools.count(1)
+
+
+class Followup:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class Interaction:
+    """Just enough of discord.Interaction for a real InteractionResponse"""
+
+    def __init__(self, command: str, session: aiohttp.ClientSession, token: str = "ok"):
+        self.id = next(_ids)
+        self.token = token
+        self.type = discord.InteractionType.application_command
+        self.command = SimpleNamespace(qualified_name=command, extras={})
+        self.data = {"name": command}
+        self.user = SimpleNamespace(id=100)
+        self.guild_id = 1
+        self.channel = None
+        self._state = SimpleNamespace(http=SimpleNamespace(proxy=None, proxy_auth=None), allowed_mentions=None)
+        self._session = session
+        self.response = discord.InteractionResponse(self)
+        self.followup = Followup()
+
+
+async def callback(request):
+    """Stand-in for Discord's interaction callback route; token "fail" is rejected"""
+    if request.match_info["token"] == "fail":
+        payload, status = {"message": "Unknown interaction", "code": 10062}, 404
+    else:
+        payload, status = {"interaction": {"id": request.match_info["id"], "type": 2}}, 200
+    # discord.py only decodes an exact application/json content type, no charset
+    return web.Response(body=json.dumps(payload).encode(), status=status, headers={"Content-Type": "application/json"})
+
+
+def run(test, monkeypatch):
+    async def main():
+        app = web.Application()
+        app.router.add_post("/interactions/{id}/{token}/callback", callback)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(discord.http.Route, "BASE", f"http://127.0.0.1:{port}")
+
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.default(), tree_cls=InstrumentedTree)
+        bot.tree.defer_budget = BUDGET
+        try:
+            async with aiohttp.ClientSession() as session:
+                await test(bot.tree, session)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_slow_handler_is_deferred_and_reply_becomes_followup(monkeypatch):
+    async def test(tree, session):
+        interaction = Interaction("slow", session)
+        tree._begin(interaction)
+        await asyncio.sleep(BUDGET * 4)
+        assert interaction.response.is_done()
+        assert await interaction.response.defer() is None
+        await interaction.response.send_message("done")
+        tree._finish(interaction, "ok")
+
+        assert interaction.followup.sent == ["done"]
+        assert AUTO_DEFERS.get(command="slow") == 1
+        assert REST_CALLS.get(command="slow") == 1
+        assert DURATION.count(command="slow") == 1
+
+    run(test, monkeypatch)
+
+
+def test_on_time_reply_is_not_deferred(monkeypatch):
+    async def test(tree, session):
+        interaction = Interaction("fast", session)
+        tree._begin(interaction)
+        await interaction.response.send_message("done")
+        await asyncio.sleep(BUDGET * 4)
+        tree._finish(interaction, "ok")
+
+        assert interaction.followup.sent == []
+        assert AUTO_DEFERS.get(command="fast") == 0
+        assert REST_CALLS.get(command="fast") == 1
+        assert REST_FAILURES.get(command="fast") == 0
+
+    run(test, monkeypatch)
+
+
+def test_rest_calls_and_failures_are_counted_per_command(monkeypatch):
+    async def test(tree, session):
+        calls = []
+
+        async def request(route, **kwargs):
+            calls.append(route)
+            if route == "bad":
+                raise discord.HTTPException(SimpleNamespace(status=500, reason="boom"), "boom")
+
+        http = SimpleNamespace(request=request)
+        tree.instrument_http(http)
+        await http.request("outside")
+
+        interaction = Interaction("counted", session, token="fail")
+        tree._begin(interaction)
+        await http.request("good")
+        with pytest.raises(discord.HTTPException):
+            await http.request("bad")
+        with pytest.raises(discord.NotFound):
+            await interaction.response.send_message("done")
+        tree._finish(interaction, "error")
+        await http.request("after")
+
+        assert calls == ["outside", "good", "bad", "after"]
+        assert REST_CALLS.get(command="counted") == 3
+        assert REST_FAILURES.get(command="counted") == 2
+
+    run(test, monkeypatch)
@@ -0,0 +1,61 @@
+import logging
+
+import pytest
+
+pytest.importorskip("discord")
+
+import logs  # noqa: E402
+from logs import RateLimitFilter  # noqa: E402
+
+
+def record(msg="Failed to assign auto-role to %s", level=logging.WARNING, name="autorole", args=(1,)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(logs.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_lets_burst_through_then_drops(clock):
+    limiter = RateLimitFilter(burst=3, interval=60)
+    assert [limiter.filter(record(args=(i,))) for i in range(5)] == [True, True, True, False, False]
+
+
+def test_reports_suppressed_count_after_window(clock):
+    limiter = RateLimitFilter(burst=2, interval=60)
+    for i in range(5):
+        limiter.filter(record(args=(i,)))
+    clock[0] += 60
+    first = record()
+    assert limiter.filter(first)
+    assert first.suppressed == 3
+    second = record()
+    assert limiter.filter(second)
+    assert not hasattr(second, "suppressed")
+
+
+def test_distinct_messages_and_levels_are_counted_separately(clock):
+    limiter = RateLimitFilter(burst=1, interval=60)
+    assert limiter.filter(record())
+    assert limiter.filter(record(msg="Other failure"))
+    assert limiter.filter(record(level=logging.ERROR))
+    assert limiter.filter(record(name="moderation"))
+    assert not limiter.filter(record())
+
+
+def test_below_level_is_never_limited(clock):
+    limiter = RateLimitFilter(burst=1, interval=60)
+    assert all(limiter.filter(record(level=logging.INFO)) for _ in range(10))
+
+
+def test_quiet_windows_are_forgotten(clock):
+    limiter = RateLimitFilter(burst=1, interval=60)
+    for i in range(1001):
+        limiter.filter(record(msg=f"message {i}"))
+    clock[0] += 61
+    limiter.filter(record(msg="fresh"))
+    limiter.filter(record(msg="another"))
+    assert len(limiter._windows) < 10
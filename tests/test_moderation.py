@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("aiohttp")
+
+from bot_commands import MOD_LOG_CHANNEL  # noqa: E402
+from harness import OfflineBot  # noqa: E402
+
+
+def run_kick(break_store=False, break_kick=False):
+    async def main():
+        async with OfflineBot() as h:
+            target = h.guild.add_member([], name="Target")
+            if break_store:
+                async def add(action):
+                    raise RuntimeError("database is locked")
+                h.bot.infractions.add = add
+            if break_kick:
+                async def kick(*, reason=None):
+                    raise RuntimeError("Missing Permissions")
+                target.kick = kick
+            interaction = await h.invoke("kick", member=target, reason="test")
+            await h.bot.mod_log.close()
+            logged = [e.title for m in h.guild.get_channel(MOD_LOG_CHANNEL).sent for e in m.embeds]
+            stored = await h.bot.infractions.by_punishment(h.guild.id, "Kick")
+        return interaction.replies, logged, stored
+
+    return asyncio.run(main())
+
+
+def test_kick_is_recorded_and_logged():
+    replies, logged, stored = run_kick()
+    assert replies[0].startswith("✅")
+    assert logged == ["Member Kicked"]
+    assert len(stored) == 1
+
+
+def test_kick_reports_success_when_bookkeeping_fails():
+    replies, logged, stored = run_kick(break_store=True)
+    assert replies[0].startswith("✅")
+    assert "could not be saved" in replies[0]
+    # The mod log is still written even though the store failed
+    assert logged == ["Member Kicked"]
+    assert stored == []
+
+
+def test_failed_kick_is_not_recorded():
+    replies, logged, stored = run_kick(break_kick=True)
+    assert replies[0].startswith("❌")
+    assert logged == []
+    assert stored == []
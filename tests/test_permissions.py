@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("discord")
+
+from permissions import Capability, PermissionEngine, compile_roles  # noqa: E402
+
+GUILD = SimpleNamespace(id=1)
+STAFF_ROLE = 10
+
+
+def role(role_id, position):
+    return SimpleNamespace(id=role_id, position=position)
+
+
+def member(*roles, member_id=100):
+    return SimpleNamespace(id=member_id, guild=GUILD, roles=list(roles))
+
+
+@pytest.fixture
+def engine():
+    return PermissionEngine(compile_roles({Capability.STAFF: {STAFF_ROLE}}))
+
+
+def test_capabilities_follow_current_roles(engine):
+    staff = member(role(STAFF_ROLE, 5))
+    assert engine.has(staff, Capability.STAFF)
+    staff.roles = []
+    assert not engine.has(staff, Capability.STAFF)
+
+
+def test_guild_configuration_overrides_default(engine):
+    engine.configure_guild(GUILD.id, compile_roles({Capability.TRAINER: {STAFF_ROLE}}))
+    staff = member(role(STAFF_ROLE, 5))
+    assert engine.has(staff, Capability.TRAINER)
+    assert not engine.has(staff, Capability.STAFF)
+
+
+def test_outranks_uses_current_target_roles(engine):
+    actor = member(role(1, 50), member_id=1)
+    target = member(role(2, 40), member_id=2)
+    assert engine.outranks(actor, target)
+    target.roles = [role(3, 60)]
+    assert not engine.outranks(actor, target)
+    assert not engine.outranks(actor, member(role(4, 50), member_id=3))
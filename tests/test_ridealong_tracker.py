@@ -0,0 +1,80 @@
+import time
+
+from ridealong_tracker import SIGNUP_EMOJI, RideAlongTracker
+
+HOST = 1
+
+
+def test_signups_keep_reaction_order():
+    tracker = RideAlongTracker()
+    session = tracker.open(100, 10, 20, HOST)
+    for user_id in (5, 3, 4):
+        assert tracker.add(100, user_id, SIGNUP_EMOJI)
+    assert tracker.roster(session) == [5, 3, 4]
+
+
+def test_ignores_host_duplicates_and_other_emoji():
+    tracker = RideAlongTracker()
+    session = tracker.open(100, 10, 20, HOST)
+    assert not tracker.add(100, HOST, SIGNUP_EMOJI)
+    assert tracker.add(100, 2, SIGNUP_EMOJI)
+    assert not tracker.add(100, 2, SIGNUP_EMOJI)
+    assert not tracker.add(100, 3, "👍")
+    assert not tracker.add(999, 3, SIGNUP_EMOJI)
+    assert tracker.roster(session) == [2]
+
+
+def test_remove_frees_the_slot():
+    tracker = RideAlongTracker()
+    session = tracker.open(100, 10, 20, HOST)
+    tracker.add(100, 2, SIGNUP_EMOJI)
+    assert tracker.remove(100, 2, SIGNUP_EMOJI)
+    assert not tracker.remove(100, 2, SIGNUP_EMOJI)
+    assert tracker.roster(session) == []
+
+
+def test_closes_when_full():
+    closed = []
+    tracker = RideAlongTracker(on_close=closed.append)
+    session = tracker.open(100, 10, 20, HOST, capacity=2)
+    tracker.add(100, 2, SIGNUP_EMOJI)
+    tracker.add(100, 3, SIGNUP_EMOJI)
+    assert session.closed and closed == [session]
+    assert not tracker.add(100, 4, SIGNUP_EMOJI)
+    assert not tracker.remove(100, 2, SIGNUP_EMOJI)
+    assert tracker.roster(session) == [2, 3]
+
+
+def test_max_signups_bounds_each_session():
+    tracker = RideAlongTracker(max_signups=2)
+    session = tracker.open(100, 10, 20, HOST)
+    assert [tracker.add(100, u, SIGNUP_EMOJI) for u in (2, 3, 4)] == [True, True, False]
+    assert len(session.signups) == 2
+
+
+def test_sessions_expire():
+    tracker = RideAlongTracker(ttl=0)
+    tracker.open(100, 10, 20, HOST)
+    time.sleep(0.001)
+    assert tracker.get(100) is None
+    assert tracker.for_host(HOST) is None
+    assert not tracker.add(100, 2, SIGNUP_EMOJI)
+    assert len(tracker) == 0
+
+
+def test_oldest_session_dropped_past_max_sessions():
+    tracker = RideAlongTracker(max_sessions=2)
+    tracker.open(100, 10, 20, HOST)
+    tracker.open(101, 10, 20, 2)
+    tracker.open(102, 10, 20, 3)
+    assert len(tracker) == 2
+    assert tracker.get(100) is None
+    assert tracker.for_host(HOST) is None
+    assert tracker.for_host(3).message_id == 102
+
+
+def test_for_host_returns_newest_session():
+    tracker = RideAlongTracker()
+    tracker.open(100, 10, 20, HOST)
+    tracker.open(101, 10, 20, HOST)
+    assert tracker.for_host(HOST).message_id == 101